@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+
+"""Asynchronous counterparts of the iterator functions, for async iterables."""
+
+import asyncio
+import collections
+
+import pymince._constants
+import pymince.functional
+import pymince.iterator
+
+empty = pymince._constants.empty
+
+
+def _aiter(iterable):
+    # Returns an async iterator of the given async iterable or (sync) iterable.
+
+    if hasattr(iterable, "__aiter__"):
+        return iterable.__aiter__()
+    else:
+        return _SyncIterator(iterable)
+
+
+class _SyncIterator:
+    __slots__ = ("_it",)
+
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        obj = next(self._it, empty)
+        if obj is empty:
+            raise StopAsyncIteration
+        return obj
+
+
+async def replacer(iterable, matcher, new_value, count=-1):
+    """
+    Make an async generator that yields all occurrences of the old "iterable"
+    replaced by "new_value".
+
+    :param iterable: Async iterable (or iterable).
+    :param matcher: Callable to find occurrences. It is an occurrence if the matcher returns True.
+    :param new_value: Any value to replace found occurrences.
+    :param int count:
+        Maximum number of occurrences to replace.
+        -1 (the default value) means replace all occurrences.
+    :rtype: AsyncGenerator
+
+    Examples:
+        from pymince.aiterator import replacer
+
+        is_one = lambda n: n == 1
+        replacer(agen([1,2,3,1,2,3]), is_one, None) # → None 2 3 None 2 3
+        replacer(agen([1,2,3,1,2,3]), is_one, None, count=1) # → None 2 3 1 2 3
+    """
+
+    changed = 0
+    async for obj in _aiter(iterable):
+        if matcher(obj) and (count == -1 or changed < count):
+            changed += 1
+            yield new_value
+        else:
+            yield obj
+
+
+async def uniquer(iterable, key=None, mode="exact", capacity=None, error_rate=0.01):
+    """
+    Make an async generator that returns each element from iterable only once
+    respecting the input order.
+
+    :param iterable: Async iterable (or iterable).
+    :param key: None or "Callable" to compare if iterable items.
+    :param str mode: "exact" (default), "window" or "bloom", see "pymince.iterator.uniquer".
+    :param int capacity: Required for "window" and "bloom" modes.
+    :param float error_rate: False-positive rate of the "bloom" mode.
+    :rtype: AsyncGenerator
+
+    Examples:
+        from pymince.aiterator import uniquer
+
+        uniquer(agen([1, 2, 3, 2])) # → 1 2 3
+    """
+
+    get = key or pymince.functional.identity
+    if mode == "exact":
+        bag = set()
+        add = bag.add
+        async for obj in _aiter(iterable):
+            if (check := get(obj)) not in bag:
+                add(check)
+                yield obj
+    else:
+        seen = pymince.iterator._make_seen(mode, capacity, error_rate)
+        async for obj in _aiter(iterable):
+            if not seen(get(obj)):
+                yield obj
+
+
+async def grouper(iterable, n, max_delay=None):
+    """
+    Make an async generator that returns tuples of consecutive elements
+    with "n" as the maximum number of elements.
+
+    :param iterable: Async iterable (or iterable).
+    :param int n: maximum size of element groups.
+    :param float max_delay:
+        Optional maximum number of seconds that the first element of a
+        group waits for the group to be filled. The incomplete group is
+        returned once it is reached, so slow streams still emit groups promptly.
+    :rtype: AsyncGenerator
+
+    Examples:
+        from pymince.aiterator import grouper
+
+        grouper(agen([1, 2, 3, 4, 5]), 2) # → (1, 2) (3, 4) (5,)
+        grouper(ticks, 100, max_delay=0.5) # → a group every 100 ticks or every 0.5 seconds
+    """
+
+    if n < 1:
+        raise ValueError('n must be at least one')
+
+    iterator = _aiter(iterable)
+    group = []
+    append = group.append
+    if max_delay is None:
+        async for obj in iterator:
+            append(obj)
+            if len(group) >= n:
+                yield tuple(group)
+                group.clear()
+    else:
+        # The elements are read ahead (at most "n") by a task, so the
+        # delay is measured while the source is waiting for the next one.
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=n)
+        pump = asyncio.ensure_future(_pump(iterator, queue))
+        deadline = None
+        try:
+            while True:
+                try:
+                    obj = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = max(0, deadline - loop.time()) if group else None
+                    try:
+                        obj = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        yield tuple(group)
+                        group.clear()
+                        continue
+
+                if obj is empty:
+                    await pump  # Raise the error of the source, if any.
+                    break
+                if not group:
+                    deadline = loop.time() + max_delay
+                append(obj)
+                if len(group) >= n:
+                    yield tuple(group)
+                    group.clear()
+        finally:
+            pump.cancel()
+
+    if group:
+        yield tuple(group)
+
+
+async def _pump(iterator, queue):
+    # Put the elements of the iterator into the queue, followed by "empty".
+
+    try:
+        async for obj in iterator:
+            await queue.put(obj)
+    except Exception:
+        await queue.put(empty)
+        raise
+    await queue.put(empty)
+
+
+async def splitter(iterable, sep, key=None, maxsplit=-1, container=None):
+    """
+    Splits an async iterable based on a separator.
+    A separator will never appear in the output.
+
+    :param iterable: Async iterable (or iterable).
+    :param sep: The delimiter to split the iterable.
+    :param key:
+        A function to compare the equality of each element with the given delimiter.
+        If the key function is not specified or is None, the element itself is used for compare.
+    :param maxsplit:
+        Maximum number of splits to do.
+        -1 (the default value) means no limit.
+    :param container: Callable to save the splits. By default tuple is used.
+
+    :return: Async generator with consecutive splits of "iterable" without the delimiter item.
+
+    Examples:
+        from pymince.aiterator import splitter
+
+        data = agen(("a", "b", "c", "d", "b", "e"))
+        split_n = splitter(data, "b")  # --> ("a",) ("c", "d") ("e",)
+        split_1 = splitter(data, "b", maxsplit=1)  # --> ("a",) ("c", "d", "b", "e")
+    """
+
+    wrap = container or tuple
+    numb = 0
+    taken = []
+    async for obj in _aiter(iterable):
+        if (maxsplit == -1 or numb < maxsplit) and (key(obj) if key else obj) == sep:
+            yield wrap(taken)
+            taken = []
+            numb += 1
+        else:
+            taken.append(obj)
+    if taken:
+        yield wrap(taken)
+
+
+async def pad_end(iterable, length, fill_value=None):
+    """
+    The function adds "fill_value" at the finishing of the async iterable,
+    until it reaches the specified length.
+    If the value of the "length" param is less than the length of
+    the given "iterable", no filling is done.
+
+    :param iterable: Async iterable (or iterable).
+    :param int length: A number specifying the desired length of the resulting iterable.
+    :param Any fill_value: Any value to fill the given iterable.
+    :rtype: AsyncGenerator
+
+    Examples:
+        from pymince.aiterator import pad_end
+
+        pad_end(agen(("a", "b")), 3, fill_value="1") # --> "a" "b" "1"
+        pad_end(agen(("a", "b")), 3) # --> "a" "b" None
+        pad_end(agen(("a", "b", "c")), 3) # --> "a" "b" "c"
+    """
+
+    fill = length
+    async for obj in _aiter(iterable):
+        fill -= 1
+        yield obj
+    for _ in range(fill):
+        yield fill_value
+
+
+class ibool:
+    """
+    Async iterator class supporting an awaitable boolean check.
+
+    Examples:
+        from pymince.aiterator import ibool
+
+        it = ibool(agen((1, 2, 3)))
+        await it.has_next() # --> True
+        [n async for n in it] # --> [1, 2, 3]
+    """
+
+    __slots__ = ("_it", "_queue")
+
+    def __init__(self, iterable):
+        self._it = _aiter(iterable)
+        self._queue = collections.deque(maxlen=1)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return self._queue.popleft() if self._queue else await self._it.__anext__()
+
+    async def has_next(self):
+        """Returns True if the iterator is not consumed, False otherwise."""
+
+        if self._queue:
+            return True
+        else:
+            try:
+                obj = await self._it.__anext__()
+            except StopAsyncIteration:  # Consumed
+                return False
+            else:
+                self._queue.append(obj)
+                return True
+
+
+class ipush:
+    """
+    Async iterator class supporting ´append´ and ´prepend´.
+
+    Examples:
+        from pymince.aiterator import ipush
+
+        it = ipush(agen([2, 3]))
+
+        it.append(4)
+        it.append(5)
+
+        it.prepend(1)
+        it.prepend(0)
+
+        [n async for n in it]  # --> [0, 1, 2, 3, 4, 5]
+    """
+
+    __slots__ = ("_it", "_prefix", "_suffix", "_consumed")
+
+    def __init__(self, iterable):
+        self._it = _aiter(iterable)
+        self._prefix = collections.deque()
+        self._suffix = collections.deque()
+        self._consumed = False
+
+    def append(self, v):
+        """Append a single value in the back of the iterator."""
+        self._suffix.append(v)
+
+    def prepend(self, v):
+        """Prepend a single value in front of the iterator."""
+        self._prefix.appendleft(v)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._prefix:
+            return self._prefix.popleft()
+        if not self._consumed:
+            try:
+                return await self._it.__anext__()
+            except StopAsyncIteration:
+                self._consumed = True
+        if self._suffix:
+            return self._suffix.popleft()
+        else:
+            raise StopAsyncIteration
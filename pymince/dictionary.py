@@ -99,12 +99,13 @@ class DigestGetter:
         Dictionary keys are sorted.
         """
 
-        return pymince.json.JSONEncoder(
+        return pymince.json._BackendEncoder(
+            cls=pymince.json.JSONEncoder,
             separators=(",", ":"),
             check_circular=False,
             sort_keys=True,
             ensure_ascii=False,
-        ).encode
+        )
 
     def to_string(self, dictionary):
         # Non-recursive copy.
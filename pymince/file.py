@@ -3,8 +3,11 @@
 """Common file operations."""
 
 import bz2
+import collections
+import concurrent.futures
 import functools
 import gzip
+import io
 import lzma
 import os
 import re
@@ -13,26 +16,131 @@ import zipfile
 
 import pymince._constants
 
-
-def xopen(name, mode="rb", encoding=None):
+# Functions to open a compressed file (path or file object), by extension.
+openers = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+# Functions to compress a whole block of data, by extension.
+compressors = {
+    ".gz": functools.partial(gzip.compress, mtime=0),
+    ".bz2": bz2.compress,
+    ".xz": lzma.compress,
+}
+
+
+def xopen(name, mode="rb", encoding=None, threads=None):
     """
     Open compressed files in Python based on their file extension.
 
     - Supports compression formats: gzip => (.gz), bzip2 => (.bz2), xz => (.xz)
     - If the file extension is not recognized, the file will be opened without compression.
     - When text mode is required, UTF-8 encoding is used by default.
-    """
+    - When "threads" is given and the file is opened for writing, independent blocks are
+      compressed in a thread pool and concatenated as a valid multi-member/multi-stream file.
+      It is ignored when reading or for uncompressed files.
+
+    Examples:
+        from pymince.file import xopen
 
-    openers = {
-        ".gz": gzip.open,
-        ".bz2": bz2.open,
-        ".xz": lzma.open,
-    }
+        with xopen("foo.txt.gz", mode="wt", threads=4) as f:
+            f.write("content")
+    """
 
     ext = os.path.splitext(name)[1]
-    fn = openers.get(ext, open)
     encoding = (encoding or pymince._constants.utf_8) if "t" in mode else None  # Text mode encoding is required.
-    return fn(name, mode=mode, encoding=encoding)
+    if threads and ext in compressors and "r" not in mode:
+        binary_mode = mode.replace("t", "").replace("b", "") + "b"
+        writer = ParallelWriter(name, compressors[ext], threads, mode=binary_mode)
+        return io.TextIOWrapper(writer, encoding=encoding) if "t" in mode else writer
+    else:
+        fn = openers.get(ext, open)
+        return fn(name, mode=mode, encoding=encoding)
+
+
+class ParallelWriter(io.BufferedIOBase):
+    """
+    Binary file-like object that compresses independent blocks of data
+    in a thread pool and writes them in order.
+
+    Compressors of the standard library (zlib, bz2, lzma) release the GIL,
+    so blocks are compressed in parallel while the caller keeps producing data.
+    The result is a concatenation of compressed members, a valid gzip, bzip2 or xz file.
+
+    :param str name: File path.
+    :param Callable[[bytes], bytes] compress: Function that compresses a whole block.
+    :param int threads: Maximum number of threads.
+    :param str mode: Binary writing mode ("wb", "ab" or "xb"). Default is "wb".
+    :param int block_size: Size in bytes of the compressed blocks. Default is 1MB.
+
+    Examples:
+        import gzip
+        from pymince.file import ParallelWriter
+
+        with ParallelWriter("foo.txt.gz", gzip.compress, 4) as f:
+            f.write(b"content")
+    """
+
+    def __init__(self, name, compress, threads, mode="wb", block_size=1024 * 1024):
+        if threads < 1:
+            raise ValueError("'threads' must be at least one")
+
+        self.name = name
+        self.mode = mode
+        self.block_size = block_size
+        self._compress = compress
+        self._fd = open(name, mode=mode)  # noqa: SIM115 Owned by the writer, closed by "close".
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads)
+        self._pending = collections.deque()
+        self._max_pending = threads * 2  # Backpressure, limits the memory used by pending blocks.
+        self._buffer = bytearray()
+        self._submitted = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        self._buffer += data
+        if len(self._buffer) >= self.block_size:
+            self._submit()
+        return memoryview(data).nbytes
+
+    def flush(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if self._buffer:
+            self._submit()
+        self._drain(0)
+        self._fd.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if not self._submitted:
+                self._submit()  # Write an empty member, as the single-threaded openers do.
+            super().close()  # Flush pending blocks.
+        finally:
+            self._executor.shutdown(wait=True)
+            self._fd.close()
+
+    def _submit(self):
+        block = bytes(self._buffer)
+        self._buffer.clear()
+        self._pending.append(self._executor.submit(self._compress, block))
+        self._submitted = True
+        self._drain(self._max_pending)
+
+    def _drain(self, limit):
+        write = self._fd.write
+        pending = self._pending
+        while len(pending) > limit:
+            write(pending.popleft().result())
 
 
 def match_from_zip(zip_file, pattern):
@@ -3,9 +3,12 @@
 """Functions that use iterators for efficient loops."""
 
 import collections
+import concurrent.futures
 import functools
 import itertools
+import math
 import operator
+import os
 import statistics
 import sys
 
@@ -46,12 +49,21 @@ def replacer(iterable, matcher, new_value, count=-1):
             yield obj
 
 
-def uniques(iterable, key=None):
+def uniques(iterable, key=None, mode="exact", capacity=None, error_rate=0.01):
     """
     Check if all the elements of a key-based iterable are unique.
 
     :param iterable:
     :param key: None or "Callable" to compare if iterable items.
+    :param str mode:
+        "exact" (default) remembers every key in a set.
+        "window" only remembers the last "capacity" distinct keys, so
+        duplicates farther apart than that are not detected.
+        "bloom" remembers the keys in a Bloom filter of fixed size, so
+        it may wrongly return False with probability "error_rate" per key
+        while no more than "capacity" distinct keys have been seen.
+    :param int capacity: Required for "window" and "bloom" modes (see "mode").
+    :param float error_rate: False-positive rate of the "bloom" mode.
     :rtype: bool
 
     Examples:
@@ -59,32 +71,120 @@ def uniques(iterable, key=None):
 
         uniques([1,2]) # --> True
         uniques([1,1]) # --> False
+        uniques([1,2,1], mode="window", capacity=1) # --> True
     """
 
-    bag = set()
-    add = bag.add
-
     values = map(key, iter(iterable)) if key else iter(iterable)
-    result = (val for val in values if val in bag or add(val))
+    if mode == "exact":
+        bag = set()
+        add = bag.add
+        result = (val for val in values if val in bag or add(val))
+    else:
+        seen = _make_seen(mode, capacity, error_rate)
+        result = filter(seen, values)
     return next(result, empty) is empty
 
 
-def uniquer(iterable, key=None):
+def uniquer(iterable, key=None, mode="exact", capacity=None, error_rate=0.01):
     """
     Make a generator that returns each element from iterable only once
     respecting the input order.
 
+    :param iterable:
+    :param key: None or "Callable" to compare if iterable items.
+    :param str mode:
+        "exact" (default) remembers every key in a set.
+        "window" only remembers the last "capacity" distinct keys
+        (least recently seen first out), so it suppresses near duplicates
+        in fixed memory.
+        "bloom" remembers the keys in a Bloom filter of fixed size, so
+        a unique element is wrongly dropped with probability "error_rate"
+        while no more than "capacity" distinct keys have been seen.
+        Duplicates are always dropped.
+    :param int capacity: Required for "window" and "bloom" modes (see "mode").
+    :param float error_rate: False-positive rate of the "bloom" mode.
+
     Examples:
         from pymince.iterator import uniquer
 
         uniquer([1, 2, 3, 2]) # → 1 2 3
+        uniquer([1, 2, 1], mode="window", capacity=1) # → 1 2 1
+        uniquer([1, 2, 1], mode="bloom", capacity=1000) # → 1 2
     """
 
     get = key or pymince.functional.identity
-    bag = set()
-    add = bag.add
+    if mode == "exact":
+        bag = set()
+        add = bag.add
+        yield from (add(check) or v for v in iter(iterable) if (check := get(v)) not in bag)
+    else:
+        seen = _make_seen(mode, capacity, error_rate)
+        yield from (v for v in iter(iterable) if not seen(get(v)))
+
+
+def _make_seen(mode, capacity, error_rate):
+    # Returns a function that records the given key and
+    # returns True if it was (maybe) already recorded.
+
+    if mode not in ("window", "bloom"):
+        raise ValueError(f"Invalid mode: {mode!r}")
+    if not capacity or capacity < 1:
+        raise ValueError(f"A positive 'capacity' is required for the mode {mode!r}")
+
+    if mode == "bloom":
+        return _BloomFilter(capacity, error_rate).add
+
+    window = collections.OrderedDict()
+    refresh = window.move_to_end
+    popitem = window.popitem
+
+    def seen(val):
+        if val in window:
+            refresh(val)
+            return True
+        window[val] = None
+        if len(window) > capacity:
+            popitem(last=False)
+        return False
+
+    return seen
+
 
-    yield from (add(check) or v for v in iter(iterable) if (check := get(v)) not in bag)
+class _BloomFilter:
+    """
+    Bit-array Bloom filter sized for "capacity" keys at the given false-positive rate.
+
+    It uses m = -n·ln(p) / ln(2)² bits and k = m/n·ln(2) hash functions,
+    the k indexes are derived from two hashes of the key (double hashing).
+    """
+
+    __slots__ = ("_bits", "_size", "_indexes")
+
+    def __init__(self, capacity, error_rate):
+        if not 0 < error_rate < 1:
+            raise ValueError("'error_rate' must be between 0 and 1")
+
+        log2 = math.log(2)
+        size = max(8, math.ceil(-capacity * math.log(error_rate) / (log2 * log2)))
+        self._size = size
+        self._bits = bytearray((size + 7) // 8)
+        self._indexes = range(max(1, round(size / capacity * log2)))
+
+    def add(self, key):
+        """Record the key and return True if it was maybe recorded before."""
+
+        bits = self._bits
+        size = self._size
+        h1 = hash((key, 0x5BD1E995))
+        h2 = hash((h1, 0x27D4EB2F)) | 1
+        present = True
+        for i in self._indexes:
+            pos = (h1 + i * h2) % size
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                present = False
+        return present
 
 
 def grouper(iterable, n):
@@ -120,6 +220,138 @@ def grouper(iterable, n):
                 break
 
 
+def grouper_by_weight(iterable, max_weight, weight=len, max_items=None):
+    """
+    Make a generator that returns tuples of consecutive elements whose
+    total weight does not exceed "max_weight", for example to batch
+    payloads by byte size instead of by count.
+
+    An element weighing more than "max_weight" is returned alone.
+
+    :param iterable:
+    :param max_weight: Maximum total weight of each group.
+    :param weight: "Callable" that returns the weight of an element (len by default).
+    :param int max_items: Optional maximum number of elements of each group.
+    :rtype: Generator
+
+    Examples:
+        from pymince.iterator import grouper_by_weight
+
+        groups = grouper_by_weight(["ab", "cd", "e", "fghi", "j"], 4)
+        list(groups) # → [("ab", "cd"), ("e",), ("fghi",), ("j",)]
+
+        groups = grouper_by_weight([1, 2, 3, 4], 10, weight=int, max_items=2)
+        list(groups) # → [(1, 2), (3, 4)]
+    """
+
+    if max_weight <= 0:
+        raise ValueError("max_weight must be positive")
+    if max_items is not None and max_items < 1:
+        raise ValueError("max_items must be at least one")
+
+    max_items = max_items or sys.maxsize
+    group = []
+    append = group.append
+    total = 0
+    for item in iterable:
+        cost = weight(item)
+        if group and total + cost > max_weight:
+            yield tuple(group)
+            group.clear()
+            total = 0
+
+        append(item)
+        total += cost
+        if total >= max_weight or len(group) >= max_items:
+            yield tuple(group)
+            group.clear()
+            total = 0
+
+    if group:
+        yield tuple(group)
+
+
+def pmap(fn, iterable, workers=None, backend="thread", prefetch=None, ordered=True, chunksize=1):
+    """
+    Make a generator that yields the results of "fn" for each element of the iterable,
+    computed concurrently in a pool of "workers" threads or processes.
+
+    Unlike `Executor.map`, the iterable is consumed lazily: at most "prefetch"
+    tasks are in flight. Elements are sent in groups of "chunksize" per task,
+    which reduces the overhead of a pool of processes.
+
+    An exception raised by "fn" is propagated when its result would be yielded,
+    after the results of the previous elements of its task, then the pending
+    tasks are cancelled.
+
+    :param fn: Callable of one argument, it must be picklable for processes.
+    :param iterable:
+    :param int workers: Size of the pool, by default the number of CPUs.
+    :param str backend: "thread" (the default) or "process".
+    :param int prefetch: Maximum number of tasks in flight, by default twice "workers".
+    :param bool ordered: If false, results are yielded as they complete instead of in the input order.
+    :param int chunksize: Number of elements of each task. Default is 1.
+    :rtype: Generator
+
+    Examples:
+        from pymince.iterator import pmap
+
+        pmap(pow, [1, 2, 3], workers=2) # → 1 4 9
+        pmap(str.upper, ["a", "b"], backend="process", chunksize=100) # → 'A' 'B'
+    """
+
+    if backend == "thread":
+        executor_class = concurrent.futures.ThreadPoolExecutor
+    elif backend == "process":
+        executor_class = concurrent.futures.ProcessPoolExecutor
+    else:
+        raise ValueError(f"Invalid backend: {backend}")
+
+    workers = workers or os.cpu_count() or 1
+    prefetch = prefetch or workers * 2
+    groups = grouper(iterable, chunksize) if chunksize > 1 else zip(iterable)
+
+    with executor_class(max_workers=workers) as executor:
+        pending = collections.deque()
+
+        def pop():
+            if ordered:
+                futures = (pending.popleft(),)
+            else:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                futures = [future for future in pending if future in done]  # In submission order.
+                for future in futures:
+                    pending.remove(future)
+            for future in futures:
+                results, error = future.result()
+                yield from results
+                if error is not None:
+                    raise error
+
+        try:
+            for group in groups:
+                pending.append(executor.submit(_map_group, fn, tuple(group)))
+                while len(pending) >= prefetch:
+                    yield from pop()
+            while pending:
+                yield from pop()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _map_group(fn, group):
+    """Return the results of "fn" for the elements of the group until one of them fails, and its error."""
+
+    results = []
+    try:
+        for obj in group:
+            results.append(fn(obj))
+    except Exception as error:
+        return (results, error)
+    return (results, None)
+
+
 def consume(iterator, n=None):
     """
     Advance *iterator* by *n* steps. If *n* is ``None``, consume it
@@ -200,12 +432,19 @@ def all_equal(iterable, key=None):
     return only_one(grouped)
 
 
-def all_distinct(iterable, key=None):
+def all_distinct(iterable, key=None, presorted=False):
     """
     Check if all the elements of a key-based iterable are distinct.
 
+    Hashable keys are checked in linear time, returning as soon as a
+    duplicate is found. Otherwise, the keys are sorted (or compared
+    one by one if they are not orderable either).
+
     :param iterable:
     :param key: None or "Callable" to compare if iterable items.
+    :param bool presorted:
+        If True, the iterable is known to be sorted by key,
+        so only consecutive elements are compared, without extra memory.
     :rtype: bool
 
     Examples:
@@ -213,10 +452,59 @@ def all_distinct(iterable, key=None):
 
         all_distinct([1, 1]) # --> False
         all_distinct([1, 2]) # --> True
+        all_distinct([1, 2, 1]) # --> False
+        all_distinct([1, 2, 1], presorted=True) # --> True
     """
 
-    grouped = itertools.groupby(iterable, key=key)
-    return all(only_one(group) for _, group in grouped)
+    values = map(key, iter(iterable)) if key else iter(iterable)
+    if presorted:
+        grouped = itertools.groupby(values)
+        return all(only_one(group) for _, group in grouped)
+
+    bag = set()
+    add = bag.add
+    current = empty
+    result = (val for val in values if (current := val) in bag or add(val))
+    try:
+        return next(result, empty) is empty
+    except TypeError:
+        if current is empty or _hashable(current):
+            raise  # Not raised by an unhashable key.
+        return _all_distinct_unhashable([*bag, current, *values])
+
+
+def _hashable(obj):
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    else:
+        return True
+
+
+def _all_distinct_unhashable(values):
+    # Sorting only brings duplicates together if the sorted keys form a chain
+    # (each one <= the next), otherwise (unorderable or partially ordered keys,
+    # such as sets) they are compared one by one.
+
+    def neighbours():
+        return zip(values, itertools.islice(values, 1, None))
+
+    try:
+        values.sort()
+        chain = all(itertools.starmap(operator.le, neighbours()))
+    except TypeError:  # Unorderable key
+        chain = False
+
+    if chain:
+        return all(itertools.starmap(operator.ne, neighbours()))
+    else:
+        seen = []
+        for val in values:
+            if val in seen:
+                return False
+            seen.append(val)
+        return True
 
 
 def only_one(iterable):
@@ -7,28 +7,373 @@ Useful functions for working with JSONs.
 - UTF-8 encoding is used by default.
 """
 
+import array
+import base64
+import codecs
+import collections
+import contextlib
 import csv
 import dataclasses
 import datetime
 import decimal
+import enum
 import functools
+import heapq
+import io
 import itertools
 import json
+import math
+import mmap
 import operator
 import os
-import textwrap
+import pathlib
+import queue
+import re
+import sys
+import tempfile
+import threading
 import uuid
+import warnings
 import zipfile
 
 import pymince._constants
+import pymince.boolean
 import pymince.file
+import pymince.iterator
 
 PROVIDER = json
 ENCODING = pymince._constants.utf_8
+INDEX_EXTENSION = ".idx"
 
-json_dumps = functools.partial(PROVIDER.dumps, ensure_ascii=False)
-json_dump = functools.partial(PROVIDER.dump, ensure_ascii=False)
-json_load = PROVIDER.load
+json_raw_decode = PROVIDER.JSONDecoder().raw_decode
+skip_whitespace = re.compile(r"[ \t\n\r]*").match
+
+# Functions to convert CSV string values according to their type.
+csv_converters = {
+    str: str,
+    int: int,
+    float: float,
+    bool: functools.partial(pymince.boolean.string2bool, ignorecase=True),
+    decimal.Decimal: decimal.Decimal,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+}
+
+digits_to_zero = bytes.maketrans(b"123456789", b"000000000")
+non_brackets = bytes(set(range(256)).difference(b"[]{}\n"))
+orjson_dumps_kwargs = frozenset(
+    ("ensure_ascii", "separators", "indent", "sort_keys", "check_circular", "allow_nan", "cls"),
+)
+
+# "binary" is true if "loads" accepts UTF-8 bytes-like objects such as a memoryview.
+# "encoder" is an optional factory, "encoder(**kwargs)" returns a function equivalent to
+# "dumps(obj, **kwargs)" that does the work that only depends on "kwargs" once.
+Backend = collections.namedtuple("Backend", ("name", "loads", "dumps", "binary", "encoder"), defaults=(False, None))
+
+
+def _stdlib_backend():
+    return Backend("stdlib", json.loads, json.dumps)
+
+
+def _stdlib_encoder(**kwargs):
+    cls = kwargs.pop("cls", None) or json.JSONEncoder
+    return cls(**kwargs).encode  # "json.dumps" would create an encoder per object.
+
+
+def _orjson_backend():
+    import orjson  # noqa: PLC0415 Optional dependency, imported when the backend is selected.
+
+    def loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity, lone surrogates... or let stdlib raise the error.
+            return json.loads(s if isinstance(s, (str, bytes, bytearray)) else bytes(s))
+
+    def encoder(**kwargs):
+        fallback = _stdlib_encoder(**kwargs)
+        option = _orjson_option(orjson, kwargs)
+        if option is None:
+            return fallback
+
+        orjson_dumps = orjson.dumps
+        default = kwargs["cls"]().default
+        ensure_ascii = kwargs.get("ensure_ascii", True)
+
+        def encode(obj):
+            try:
+                res = orjson_dumps(obj, default=default, option=option)
+            except orjson.JSONEncodeError:
+                # Non-str keys, big integers, circular references... or let stdlib raise the error.
+                return fallback(obj)
+
+            # With "ensure_ascii", orjson only matches stdlib if the output is ASCII without DEL.
+            if ensure_ascii and not (res.isascii() and b"\x7f" not in res):
+                return fallback(obj)
+            if _orjson_float_mismatch(res) or (b"null" in res and _has_non_finite(obj, default)):
+                return fallback(obj)
+            return res.decode()
+
+        return encode
+
+    def dumps(obj, **kwargs):
+        return encoder(**kwargs)(obj)
+
+    return Backend("orjson", loads, dumps, binary=True, encoder=encoder)
+
+
+def _orjson_float_mismatch(res):
+    # Float notations written by orjson that differ from `repr`: "1e16" or "0.00001".
+    # A match inside a string value only causes an unnecessary fallback.
+    return b"0e" in res.translate(digits_to_zero) or b".0000" in res
+
+
+def _has_non_finite(obj, default):
+    # Whether "obj" holds a NaN or an infinity, that orjson writes as null
+    # (stdlib writes them or raises ValueError). Only checked if the output has a null.
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    isfinite = math.isfinite
+    while stack:
+        obj = pop()
+        kind = type(obj)
+        if kind in _finite_types:
+            continue
+        elif kind is float:
+            if not isfinite(obj):
+                return True
+        elif kind is dict:
+            extend(obj.values())
+        elif kind is list or kind is tuple:
+            extend(obj)
+        elif isinstance(obj, float):
+            push(float(obj))
+        elif isinstance(obj, (str, int)):
+            continue
+        elif isinstance(obj, dict):
+            extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            extend(obj)
+        else:
+            push(default(obj))
+    return False
+
+
+_finite_types = frozenset((str, int, bool, type(None)))
+
+
+def _orjson_option(orjson, kwargs):
+    # Return the orjson option that reproduces the output of "json.dumps(**kwargs)", or None.
+    if not kwargs.keys() <= orjson_dumps_kwargs or kwargs.get("allow_nan") is False:
+        return None
+    cls = kwargs.get("cls")
+    if not cls or not _orjson_encoder(cls):
+        return None  # Only stdlib raises TypeError for enums and UUIDs without converters.
+
+    # Route these types to "default" like stdlib does.
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    indent = kwargs.get("indent")
+    separators = kwargs.get("separators")
+    if indent is None and separators == (",", ":"):
+        pass
+    elif indent == 2 and separators in (None, (",", ": ")):
+        option |= orjson.OPT_INDENT_2
+    else:
+        return None
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+def _orjson_encoder(cls):
+    # orjson serializes enums and UUIDs natively, so their converters must be the default ones.
+    return (
+        issubclass(cls, JSONEncoder)
+        and cls.default is JSONEncoder.default
+        and cls.encode is JSONEncoder.encode
+        and cls.iterencode is JSONEncoder.iterencode
+        and all(
+            fn is JSONEncoder.converters.get(kind)
+            for kind, fn in cls.converters.items()
+            if issubclass(kind, (enum.Enum, uuid.UUID))
+        )
+    )
+
+
+def _ujson_backend():
+    import ujson  # noqa: PLC0415 Optional dependency, imported when the backend is selected.
+
+    def loads(s):
+        try:
+            return ujson.loads(s)
+        except (ValueError, OverflowError):
+            return json.loads(s)
+
+    # The ujson encoder output differs in floats, escapes and non-str keys.
+    return Backend("ujson", loads, json.dumps)
+
+
+# Functions that create each backend, they raise ImportError if the package is not installed.
+backends = {
+    "stdlib": _stdlib_backend,
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+}
+_backend = _stdlib_backend()
+_encoders = {}  # See `_cached_encoder`.
+
+
+def use_backend(backend):
+    """
+    Select the JSON backend used by this module and by the modules that use it
+    (`pymince.dictionary.DigestGetter`, `pymince.logging.StructuredFormatter`).
+
+    Backends produce the same output as the standard library:
+    - `orjson`: only encodes when it writes the same bytes, i.e. with the compact separators
+      or "indent=2" (and ASCII output if "ensure_ascii"), otherwise falls back to stdlib per call.
+      It requires "cls" to be `JSONEncoder`, since orjson serializes enums and UUIDs that stdlib rejects.
+    - `ujson`: only decodes.
+    Decoding errors are always re-raised by stdlib as `json.JSONDecodeError`.
+
+    If the backend package is not installed, a warning is issued and stdlib is used.
+
+    :param backend: "stdlib", "orjson", "ujson" or a custom `Backend(name, loads, dumps, binary=False, encoder=None)`
+    whose functions are compatible with `json.loads` and `json.dumps`, "binary" tells
+    that "loads" also accepts UTF-8 bytes-like objects and "encoder(**kwargs)", if given,
+    returns a function equivalent to "dumps(obj, **kwargs)".
+    :return: Name of the backend in use.
+    :rtype: str
+
+    Examples:
+        from pymince.json import Backend, use_backend
+
+        use_backend("orjson") # --> "orjson" or "stdlib" if it is not installed
+        use_backend(Backend("custom", loads, dumps)) # --> "custom"
+    """
+
+    global _backend  # noqa: PLW0603 Module state read on every call, `_BackendEncoder` compares it by identity.
+
+    if isinstance(backend, Backend):
+        _backend = backend
+    elif backend in backends:
+        try:
+            _backend = backends[backend]()
+        except ImportError:
+            warnings.warn(f"JSON backend {backend!r} is not installed, using 'stdlib'.", RuntimeWarning, stacklevel=2)
+            _backend = _stdlib_backend()
+    else:
+        raise ValueError(f"Unknown JSON backend: {backend!r}")
+    _encoders.clear()
+    return _backend.name
+
+
+def json_dumps(obj, **kwargs):
+    """
+    Serialize "obj" to a JSON formatted string with the backend in use (see `use_backend`).
+
+    :param obj: Object to serialize.
+    :param kwargs: Same arguments as `json.dumps`, "ensure_ascii" is False by default.
+    :rtype: str
+
+    Examples:
+        from pymince.json import json_dumps
+
+        json_dumps({"a": "ñ"}, separators=(",", ":")) # --> '{"a":"ñ"}'
+    """
+
+    kwargs.setdefault("ensure_ascii", False)
+    if _backend.encoder is None:
+        return _backend.dumps(obj, **kwargs)
+    else:
+        return _cached_encoder(kwargs)(obj)
+
+
+def _cached_encoder(kwargs):
+    # Encoders of the backend in use by "json_dumps" kwargs,
+    # the cache is cleared when the backend or the `JSONEncoder` converters change.
+    try:
+        key = frozenset(kwargs.items())
+        return _encoders[key]
+    except TypeError:  # Unhashable argument
+        return _backend.encoder(**kwargs)
+    except KeyError:
+        if len(_encoders) >= 128:
+            _encoders.clear()
+        encode = _encoders[key] = _backend.encoder(**kwargs)
+        return encode
+
+
+def json_encoder(**kwargs):
+    """Return a function equivalent to "json_dumps(obj, **kwargs)" to encode many objects."""
+
+    kwargs.setdefault("ensure_ascii", False)
+    if _backend.encoder is not None:
+        return _backend.encoder(**kwargs)
+    elif _backend.dumps is json.dumps:
+        return _stdlib_encoder(**kwargs)
+    else:
+        return functools.partial(_backend.dumps, **kwargs)
+
+
+class _BackendEncoder:
+    """
+    Function equivalent to "json_dumps(obj, **kwargs)" that resolves
+    the "json_encoder" of the backend in use once, and again only if the backend changes.
+    """
+
+    __slots__ = ("_kwargs", "_backend", "_encode")
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._backend = None
+        self._encode = None
+
+    def __call__(self, obj):
+        if self._backend is not _backend:
+            self._backend, self._encode = (_backend, json_encoder(**self._kwargs))
+        return self._encode(obj)
+
+
+def json_dump(obj, fd, **kwargs):
+    """
+    Serialize "obj" as a JSON formatted stream to "fd" with the backend in use (see `use_backend`).
+
+    :param obj: Object to serialize.
+    :param fd: Text file-like object with a "write" method.
+    :param kwargs: Same arguments as `json.dump`, "ensure_ascii" is False by default.
+    """
+
+    kwargs.setdefault("ensure_ascii", False)
+    if _backend.dumps is json.dumps:
+        json.dump(obj, fd, **kwargs)  # Streaming
+    else:
+        fd.write(json_dumps(obj, **kwargs))
+
+
+def json_loads(s):
+    """
+    Deserialize "s" (str, bytes or bytearray) to a Python object with the backend in use (see `use_backend`).
+
+    :raise json.JSONDecodeError: If "s" is not a valid JSON document.
+    """
+
+    return _backend.loads(s)
+
+
+def json_load(fd):
+    """
+    Deserialize a JSON document from "fd" with the backend in use (see `use_backend`).
+
+    :param fd: File-like object with a "read" method.
+    :raise json.JSONDecodeError: If the content is not a valid JSON document.
+    """
+
+    if _backend.loads is json.loads:
+        return json.load(fd)
+    else:
+        return _backend.loads(fd.read())
 
 
 def load_from(filename, encoding=ENCODING):
@@ -45,14 +390,224 @@ def load_from(filename, encoding=ENCODING):
         dictionary4 = load_from("foo.json.bz2") # bz2-compressed
     """
 
+    if os.path.splitext(filename)[1] in pymince.file.openers:
+        with pymince.file.xopen(filename, mode="rt", encoding=encoding) as fd:
+            return json_load(fd)
+    else:
+        return _load_mapped(filename, encoding)
+
+
+def _load_mapped(filename, encoding):
+    """
+    Load JSON from an uncompressed file through a memory map, decoding it
+    without an intermediate read buffer, or passing the mapped bytes
+    to the backend if it accepts them.
+    """
+
+    with open(filename, mode="rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Empty or not mappable file.
+            return json_loads(f.read().decode(encoding))
+
+        with mm:
+            if _backend.binary and codecs.lookup(encoding).name == "utf-8":
+                with memoryview(mm) as view:
+                    return _backend.loads(view)
+            text = str(mm, encoding)
+    return json_loads(text)
+
+
+def iload_from(filename, encoding=ENCODING, size=64 * 1024):
+    """
+    Make a generator that yields the elements of a JSON array file one at a time.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions to load compressed files.
+
+    It is the inverse of `idump_into`, the file is decoded incrementally
+    over fixed-size read blocks, so only one element is kept in memory.
+    Useful to reduce memory consumption
+
+    :param str filename:
+    :param str encoding: utf-8 is used by default.
+    :param int size: Read up-to-size characters from file for each block. Default is 64KB.
+    :rtype: Generator
+
+    Examples:
+        from pymince.json import iload_from
+
+        for item in iload_from("foo.json.gz"):
+            print(item)
+    """
+
     with pymince.file.xopen(filename, mode="rt", encoding=encoding) as fd:
-        return json.load(fd)
+        yield from _iload_array(fd.read, size)
+
+
+def _iload_array(read, size):
+    """
+    Make a generator that yields the elements of a JSON array
+    decoded incrementally from the given "read" callable.
+    The input is read until the end, only whitespace may follow the array.
+
+    :param Callable[[int], str] read: Read up-to-n characters, returns "" at the end.
+    :param int size: Minimum number of characters to request on each read.
+    :rtype: Generator
+    """
+
+    def read_more():
+        # Keep the unparsed tail and read at least as much as is pending, so that
+        # elements larger than "size" are retried a logarithmic number of times.
+        nonlocal offset, lines, column
+        consumed = buffer[:pos]
+        newlines = consumed.count("\n")
+        offset += pos
+        lines += newlines
+        column = len(consumed) - consumed.rfind("\n") - 1 if newlines else column + len(consumed)
+
+        chunk = read(max(size, len(buffer) - pos))
+        return (buffer[pos:] + chunk, 0, not chunk)
+
+    def error(msg, at):
+        # Decoding error with its position relative to the whole input.
+        exc = json.JSONDecodeError(msg, buffer, at)
+        return _shift_decode_error(exc, offset, lines, column)
+
+    offset, lines, column = (0, 0, 0)  # Position of the buffer start.
+    expected = "["
+    buffer, pos, eof = ("", 0, False)
+    while True:
+        pos = skip_whitespace(buffer, pos).end()
+        if pos == len(buffer):
+            if eof and expected == "end":
+                return
+            elif eof:
+                raise error("Unexpected end of JSON array", pos)
+            buffer, pos, eof = read_more()
+            continue
+
+        char = buffer[pos]
+        if expected == "[":
+            if char != "[":
+                raise error("Expecting '['", pos)
+            pos += 1
+            expected = "value or ]"
+        elif expected == "end":
+            raise error("Extra data", pos)  # Only whitespace is allowed after the array, like `json.loads`.
+        elif char == "]" and expected != "value":
+            pos += 1
+            expected = "end"
+        elif char == "," and expected == ", or ]":
+            pos += 1
+            expected = "value"
+        elif expected == ", or ]":
+            raise error("Expecting ',' delimiter", pos)
+        else:
+            try:
+                obj, end = json_raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                if eof or not _maybe_truncated(exc, buffer):
+                    raise _shift_decode_error(exc, offset, lines, column) from None
+                buffer, pos, eof = read_more()
+                continue
+
+            after = skip_whitespace(buffer, end).end()
+            if not eof and (after == len(buffer) or (buffer[after] not in ",]" and len(buffer) - after <= 2)):
+                # The value could be truncated at the end of the block,
+                # even a number followed by the start of its fraction or exponent ("1." or "1e+").
+                buffer, pos, eof = read_more()
+                continue
+            yield obj
+            pos = after
+            expected = ", or ]"
+
 
+def _maybe_truncated(exc, buffer):
+    # Whether a decoding error could be caused by an incomplete buffer:
+    # it is found at most a few characters before the end (e.g. "tru", "1e", "\\u00")
+    # or inside a string that is not closed yet.
+    return len(buffer) - exc.pos <= 6 or exc.msg.startswith("Unterminated string")
 
-def dump_into(filename, obj, encoding=ENCODING, **kwargs):
+
+def _shift_decode_error(exc, offset, lines, column):
+    # Returns a copy of the decoding error of a buffer that
+    # starts at the given position (offset, line and column) of the input.
+
+    lineno = exc.lineno + lines
+    colno = exc.colno + column if exc.lineno == 1 else exc.colno
+    pos = exc.pos + offset
+    shifted = json.JSONDecodeError(exc.msg, "", 0)
+    shifted.args = (f"{exc.msg}: line {lineno} column {colno} (char {pos})",)
+    shifted.doc, shifted.pos, shifted.lineno, shifted.colno = (exc.doc, pos, lineno, colno)
+    return shifted
+
+
+def iload_fields(filename, fields, ndjson=False, encoding=ENCODING):
+    """
+    Make a generator that yields slim dictionaries with only the given fields
+    of the elements of a JSON array file or a JSON Lines (NDJSON) file.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions to load compressed files.
+
+    This is a projection after decoding: each element is fully decoded
+    (by `iload_from` or `iload_lines`) and then reduced to the given fields,
+    the other fields are not skipped while parsing, so it does not speed up decoding.
+    It only saves memory, since one complete element is kept at a time
+    and the yielded dictionaries hold the requested fields only.
+    Missing fields are omitted, elements that are not objects are yielded unchanged.
+
+    :param str filename:
+    :param fields: Field names, nested fields are separated by dots, or given as tuples of keys.
+    :param bool ndjson: If true, the file is read as JSON Lines.
+    :param str encoding: utf-8 is used by default.
+    :rtype: Generator
+
+    Examples:
+        from pymince.json import iload_fields
+
+        iload_fields("foo.json.gz", ("id", "user.name"))  # --> {"id": 1, "user": {"name": "foo"}} ...
+        iload_fields("foo.jsonl", ("id",), ndjson=True)  # --> {"id": 1} ...
+    """
+
+    project = _make_projector(fields)
+    items = iload_lines(filename, encoding=encoding) if ndjson else iload_from(filename, encoding=encoding)
+    yield from map(project, items)
+
+
+def _make_projector(fields):
+    """Return a function that picks the given (nested) fields from an object."""
+
+    tree = dict()  # Nested keys, None means the whole value.
+    for field in fields:
+        keys = field.split(".") if isinstance(field, str) else tuple(field)
+        node = tree
+        for key in keys[:-1]:
+            node = node.setdefault(key, dict())
+            if node is None:  # The whole parent value was already requested.
+                break
+        else:
+            node[keys[-1]] = None
+
+    def project(obj, node=tree):
+        if not isinstance(obj, dict):
+            return obj
+
+        result = dict()
+        for key, child in node.items():
+            if key in obj:
+                value = obj[key]
+                if child is None:
+                    result[key] = value
+                elif isinstance(value, dict):
+                    result[key] = project(value, child)
+        return result
+
+    return project
+
+
+def dump_into(filename, obj, encoding=ENCODING, threads=None, **kwargs):
     """
     Dump JSON to a file.
     Use (`.gz`, `.xz`, `.bz2`) extensions to create compressed files.
+    Use "threads" to compress blocks in parallel, see `pymince.file.xopen`.
 
     Examples:
         from pymince.json import dump_into
@@ -63,7 +618,7 @@ def dump_into(filename, obj, encoding=ENCODING, **kwargs):
         dump_into("foo.json.bz2", {"key": "value"}) # bz2-compressed
     """
 
-    with pymince.file.xopen(filename, mode="wt", encoding=encoding) as fd:
+    with pymince.file.xopen(filename, mode="wt", encoding=encoding, threads=threads) as fd:
         json_dump(obj, fd, **kwargs)
 
 
@@ -75,11 +630,72 @@ def dump_into_zip(zip_path, arcname, payload, **kwargs):
         from pymince.json import dump_into_zip
 
         dump_into_zip("archive.zip", "foo.json", {"key": "value"})
+
+    See `ZipJSONWriter` to write many members in the same archive.
+    """
+
+    with ZipJSONWriter(zip_path, mode="w", compression=zipfile.ZIP_STORED) as writer:
+        writer.dump(arcname, payload, **kwargs)
+
+
+class ZipJSONWriter:
+    """
+    Write many JSON members into a zip archive that is kept open.
+    Each member is streamed into the archive, so only one element
+    is kept in memory when dumping iterables.
+
+    :param str zip_path:
+    :param str mode: "a" (the default) to append to an existing or new archive, "w" to truncate it.
+    :param int compression: `zipfile` compression method. Default is `zipfile.ZIP_DEFLATED`.
+    :param int compresslevel: Compression level, None for the default of the method.
+    :param str encoding: utf-8 is used by default.
+
+    Examples:
+        from pymince.json import ZipJSONWriter
+
+        with ZipJSONWriter("archive.zip") as writer:
+            writer.dump("foo.json", {"key": "value"})
+            writer.idump("var.json", ({"value": n} for n in range(1000)))
     """
 
-    with zipfile.ZipFile(zip_path, mode="w") as zf:
-        json_string = json_dumps(payload, **kwargs)
-        zf.writestr(arcname, json_string)
+    def __init__(
+        self,
+        zip_path,
+        mode="a",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=None,
+        encoding=ENCODING,
+    ):
+        self.encoding = encoding
+        self.zf = zipfile.ZipFile(zip_path, mode=mode, compression=compression, compresslevel=compresslevel)
+
+    def dump(self, arcname, obj, **kwargs):
+        """Dump JSON into the archive under the name arcname."""
+
+        with self.open(arcname) as fd:
+            json_dump(obj, fd, **kwargs)
+
+    def idump(self, arcname, iterable, **kwargs):
+        """Dump an iterable incrementally as a JSON array into the archive under the name arcname."""
+
+        with self.open(arcname) as fd:
+            fd.writelines(idump_lines(iterable, **kwargs))
+
+    def open(self, arcname):
+        """Return a text file-like object to write the member arcname."""
+
+        # Members larger than 2GB require ZIP64 extensions, the final size is unknown.
+        member = self.zf.open(arcname, mode="w", force_zip64=True)
+        return io.TextIOWrapper(member, encoding=self.encoding)
+
+    def close(self):
+        self.zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
 
 def load_from_zip(zip_path, arcname):
@@ -93,7 +709,61 @@ def load_from_zip(zip_path, arcname):
     """
 
     with zipfile.ZipFile(zip_path, mode="r") as zf, zf.open(arcname) as file:
-        return json.load(file)
+        return json_load(file)
+
+
+def iload_from_zip(zip_path, names, workers=None, backend="thread", ordered=True):
+    """
+    Make a generator that yields `(arcname, obj)` pairs loading many JSON members
+    from a zip archive, whose central directory is read only once.
+
+    :param str zip_path:
+    :param names: "re.Pattern" to filter the member names (see `pymince.file.match_from_zip`) or an iterable of names.
+    :param int workers: If given, members are decompressed and loaded in a pool of "workers".
+    :param str backend:
+        "thread" (the default) shares the open archive, decompression releases the GIL.
+        "process" loads batches of members in a pool of processes.
+    :param bool ordered: If false, pairs are yielded as they complete instead of in the given order.
+    :rtype: Generator
+
+    Examples:
+        from pymince.json import iload_from_zip
+
+        for arcname, obj in iload_from_zip("archive.zip", "^data/", workers=8):
+            print(arcname, obj)
+    """
+
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Invalid backend: {backend}")
+
+    with zipfile.ZipFile(zip_path, mode="r") as zf:
+        arcnames = list(pymince.file.match_from_zip(zf, names) if isinstance(names, str) else names)
+        if not workers:
+            yield from zip(arcnames, map(functools.partial(_load_zip_member, zf), arcnames))
+        elif backend == "thread":
+            load = functools.partial(_load_zip_members, zf)
+            for pairs in pymince.iterator.pmap(load, zip(arcnames), workers=workers, ordered=ordered):
+                yield from pairs
+        else:
+            load = functools.partial(_load_zip_members, zip_path)
+            batches = map(tuple, pymince.iterator.grouper(arcnames, max(len(arcnames) // (workers * 4), 1)))
+            for pairs in pymince.iterator.pmap(load, batches, workers=workers, backend="process", ordered=ordered):
+                yield from pairs
+
+
+def _load_zip_member(zf, arcname):
+    with zf.open(arcname) as file:
+        return json_load(file)
+
+
+def _load_zip_members(zip_file, arcnames):
+    """Return the `(arcname, obj)` pairs of given members, "zip_file" is a ZipFile or a zip path."""
+
+    if isinstance(zip_file, zipfile.ZipFile):
+        return [(arcname, _load_zip_member(zip_file, arcname)) for arcname in arcnames]
+    else:
+        with zipfile.ZipFile(zip_file, mode="r") as zf:
+            return _load_zip_members(zf, arcnames)
 
 
 def csv_to_json(
@@ -106,6 +776,11 @@ def csv_to_json(
     stop=None,
     strip=True,
     encoding=ENCODING,
+    threads=None,
+    workers=None,
+    ndjson=False,
+    schema=None,
+    infer=False,
     **kwargs,
 ):
     """
@@ -123,23 +798,237 @@ def csv_to_json(
         Whether white space should be removed from the
         beginning and end of field values.
     :param str encoding: utf-8 is used by default.
+    :param int threads: Compress blocks in parallel, see `pymince.file.xopen`.
+    :param int workers:
+        If given, the CSV file is split into chunks aligned to record boundaries
+        that are converted in a pool of "workers" processes, the output keeps the CSV order.
+        Requires an ASCII-compatible encoding and quote characters only inside quoted fields.
+    :param bool ndjson: If true, dump a JSON Lines (NDJSON) file instead of a JSON array.
+    :param dict schema:
+        Mapping of JSON keys to the type of their values: `int`, `float`, `decimal.Decimal`,
+        `bool` (see `pymince.boolean.string2bool`), `datetime.date`, `datetime.datetime`, `str`
+        or any callable that receives the string value. Empty values are converted to None.
+        Values that cannot be converted raise an error, e.g.: ValueError.
+    :param infer:
+        If true, the types of keys not included in "schema" are inferred from the first 1000
+        dumped rows, or from the given number of rows.
+        Candidate types are `bool`, `int`, `float`, `datetime.date` and `datetime.datetime`.
+
+    Examples:
+        from pymince.json import csv_to_json
+
+        csv_to_json("foo.csv", "foo.json")
+        csv_to_json("foo.csv", "foo.json.gz", workers=4, threads=4)
+        csv_to_json("foo.csv", "foo.jsonl", ndjson=True)
+        csv_to_json("foo.csv", "foo.json", schema={"id": int, "price": decimal.Decimal})
+        csv_to_json("foo.csv", "foo.json", infer=True)
     """
 
-    def read():
-        reader = csv.DictReader(csv_f, fieldnames=fieldnames)
-        if strip:
-            apply = operator.methodcaller("strip")
-            for row in reader:
-                yield {k and apply(k): (apply(v) if isinstance(v, str) else v) for k, v in row.items()}
+    if infer:
+        sample = 1000 if infer is True else infer
+        with open(csv_path, encoding=encoding, newline="") as csv_f:
+            rows = itertools.islice(_iread_csv(csv_f, fieldnames, strip), start, start + sample)
+            schema = {**_infer_csv_schema(rows), **(schema or {})}
+    if schema:
+        kwargs.setdefault("cls", JSONEncoder)  # Encodes `decimal.Decimal` and dates.
+
+    if workers:
+        lines = _icsv_to_json_parallel(csv_path, fieldnames, start, strip, encoding, workers, ndjson, schema, kwargs)
+        lines = itertools.islice(lines, None if stop is None else max(stop - start, 0))
+        with pymince.file.xopen(json_path, mode="wt", encoding=encoding, threads=threads) as fd:
+            fd.writelines(lines if ndjson else _array_lines(lines))
+    else:
+        with open(csv_path, encoding=encoding, newline="") as csv_f:
+            # The official csv doc recommends opening the file with newline='' on all platforms to disable
+            # universal newlines translation.
+
+            data = itertools.islice(_iread_csv(csv_f, fieldnames, strip), start, stop)
+            data = _convert_csv(data, schema) if schema else data
+            dump = dump_ndjson_into if ndjson else idump_into
+            dump(json_path, data, encoding=encoding, threads=threads, **kwargs)
+
+
+def _iread_csv(csv_f, fieldnames, strip):
+    reader = csv.DictReader(csv_f, fieldnames=fieldnames)
+    if strip:
+        apply = operator.methodcaller("strip")
+        for row in reader:
+            yield {k and apply(k): (apply(v) if isinstance(v, str) else v) for k, v in row.items()}
+    else:
+        yield from reader
+
+
+def _convert_csv(rows, schema):
+    # Converters are resolved once, not for each row.
+    converters = tuple((key, csv_converters.get(kind, kind)) for key, kind in schema.items())
+
+    def convert(row):
+        for key, fn in converters:
+            value = row.get(key)
+            if isinstance(value, str):
+                row[key] = fn(value) if value else None
+        return row
+
+    return map(convert, rows)
+
+
+def _infer_csv_schema(rows):
+    """Infer the type of the values of each key, given a sample of CSV rows."""
+
+    def matches(kind, values):
+        if kind in (int, float) and any(map(leading_zeros, values)):
+            return False  # Identifiers must be preserved as written, e.g.: zip codes "01234"
+        try:
+            pymince.iterator.consume(map(csv_converters[kind], values))
+        except (ValueError, ArithmeticError):
+            return False
         else:
-            yield from reader
+            return True
+
+    leading_zeros = re.compile(r"\s*[+-]?0\d").match
 
-    with open(csv_path, encoding=encoding, newline="") as csv_f:
-        # The official csv doc recommends opening the file with newline='' on all platforms to disable
-        # universal newlines translation.
+    candidates = (bool, int, float, datetime.date, datetime.datetime)
+    samples = collections.defaultdict(list)
+    for row in rows:
+        for key, value in row.items():
+            if isinstance(value, str) and value:
+                samples[key].append(value)
 
-        data = itertools.islice(read(), start, stop)
-        idump_into(json_path, data, encoding=encoding, **kwargs)
+    schema = dict()
+    for key, values in samples.items():
+        kind = next((kind for kind in candidates if matches(kind, values)), None)
+        if kind:
+            schema[key] = kind
+    return schema
+
+
+def _icsv_to_json_parallel(csv_path, fieldnames, start, strip, encoding, workers, ndjson, schema, dumps_kwargs):
+    """
+    Generator yielding the encoded CSV rows converted by a pool of processes,
+    respecting the CSV order and skipping the first "start" rows.
+    """
+
+    if fieldnames is None:
+        # The header is read once, chunks are converted with the given fieldnames.
+        with open(csv_path, encoding=encoding, newline="") as csv_f:
+            fieldnames = next(csv.reader(csv_f), [])
+        start += 1
+
+    with open(csv_path, mode="rb") as f:
+        offset = _csv_skip_records(f, start)
+
+    offsets = _csv_record_offsets(csv_path, offset, workers * 4)
+    convert = functools.partial(
+        _csv_chunk_to_json,
+        csv_path,
+        fieldnames=fieldnames,
+        strip=strip,
+        encoding=encoding,
+        ndjson=ndjson,
+        schema=schema,
+        dumps_kwargs=dumps_kwargs,
+    )
+    # Backpressure, limits the memory used by converted chunks.
+    for lines in pymince.iterator.pmap(convert, zip(offsets, offsets[1:]), workers=workers, backend="process"):
+        yield from lines
+
+
+def _csv_chunk_to_json(csv_path, chunk_range, *, fieldnames, strip, encoding, ndjson, schema, dumps_kwargs):
+    """Convert the CSV records between the byte offsets "chunk_range" (start, stop) into encoded JSON strings."""
+
+    start, stop = chunk_range
+    with open(csv_path, mode="rb") as f:
+        f.seek(start)
+        text = f.read(stop - start).decode(encoding)
+
+    rows = _iread_csv(io.StringIO(text, newline=""), fieldnames, strip)
+    rows = _convert_csv(rows, schema) if schema else rows
+    if ndjson:
+        return list(idump_lines_ndjson(rows, **dumps_kwargs))
+    else:
+        return list(map(_make_encoder(**dumps_kwargs), rows))
+
+
+def _csv_record_offsets(csv_path, start, parts, size=1024 * 1024):
+    """
+    Return the sorted byte offsets that split the CSV file into about "parts" chunks
+    beginning at "start", which must be the beginning of a record.
+    """
+
+    total = os.path.getsize(csv_path)
+    step = max((total - start) // parts, 1)
+    offsets = [start]
+    pos = start
+    quotes = 0
+    with open(csv_path, mode="rb") as f:
+        for target in range(start + step, total, step):
+            if target > pos:
+                f.seek(pos)
+                while pos < target:
+                    block = f.read(min(size, target - pos))
+                    quotes += block.count(b'"')
+                    pos += len(block)
+                pos, quotes = _csv_record_end(f, pos, quotes, size)
+                if pos < total:
+                    offsets.append(pos)
+    offsets.append(total)
+    return offsets
+
+
+def _csv_skip_records(f, count, size=1024 * 1024):
+    """
+    Return the byte offset where the record after the first "count" records
+    of the binary CSV file "f" begins, scanning it once from the beginning.
+    Blank lines are not counted as records.
+    """
+
+    pos = 0  # Offset of the current block.
+    begin = 0  # Offset of the current record.
+    quotes = 0
+    last = None  # Last byte of the previous block.
+    while count > 0 and (block := f.read(size)):
+        start = 0
+        index = block.find(b"\n")
+        while index != -1:
+            quotes += block.count(b'"', start, index)
+            if quotes % 2 == 0:
+                end = pos + index + 1
+                length = end - 1 - begin
+                if length > 1 or (length == 1 and (block[index - 1] if index else last) != ord("\r")):
+                    count -= 1
+                    if count == 0:
+                        return end
+                begin = end
+            start = index
+            index = block.find(b"\n", index + 1)
+        quotes += block.count(b'"', start)
+        last = block[-1]
+        pos += len(block)
+    return pos
+
+
+def _csv_record_end(f, pos, quotes, size=1024 * 1024):
+    """
+    Return the byte offset where the next CSV record begins after "pos" and
+    the updated count of quote characters, reading the binary file "f".
+
+    A newline ends a record when an even number of quote characters precedes it,
+    which holds for the quoting rules of the default CSV dialect.
+    """
+
+    f.seek(pos)
+    while block := f.read(size):
+        begin = 0
+        index = block.find(b"\n")
+        while index != -1:
+            quotes += block.count(b'"', begin, index)
+            if quotes % 2 == 0:
+                return (pos + index + 1, quotes)
+            begin = index
+            index = block.find(b"\n", index + 1)
+        quotes += block.count(b'"', begin)
+        pos += len(block)
+    return (pos, quotes)
 
 
 def idump_lines(iterable, **dumps_kwargs):
@@ -153,29 +1042,89 @@ def idump_lines(iterable, **dumps_kwargs):
     :rtype: Iterable[str]
     """
 
-    it = iter(iterable)
-    encode = functools.partial(json_dumps, **dumps_kwargs)
-    indent = dumps_kwargs.get("indent")
-    prefix = " " * indent if indent else ""
+    iencode = _make_iencoder(**dumps_kwargs)
+    yield "[\n"
+    for i, obj in enumerate(iterable):
+        if i:
+            yield ",\n"
+        yield from iencode(obj)
+    yield "\n"
+    yield "]"
+
+
+def _make_encoder(**dumps_kwargs):
+    """Return a function that serializes an element of a JSON array."""
+
+    encode = json_encoder(**dumps_kwargs)
+    prefix = _indent_prefix(dumps_kwargs.get("indent"))
+    if prefix:
+        # The elements are one level deep, JSON strings never contain a raw newline.
+        newline = "\n" + prefix
+        return lambda obj: prefix + encode(obj).replace("\n", newline)
+    else:
+        return encode
+
+
+def _make_iencoder(**dumps_kwargs):
+    """
+    Return a function that serializes an element of a JSON array into string chunks,
+    so a large element is not materialized when it is pretty-printed.
+    """
+
+    prefix = _indent_prefix(dumps_kwargs.get("indent"))
+    if not prefix or _backend.dumps is not json.dumps:
+        encode = _make_encoder(**dumps_kwargs)
+        return lambda obj: (encode(obj),)
+
+    kwargs = {"ensure_ascii": False, **dumps_kwargs}
+    iterencode = (kwargs.pop("cls", None) or json.JSONEncoder)(**kwargs).iterencode
+    newline = "\n" + prefix
+
+    def iencode(obj, size=4096):
+        chunks = iterencode(obj)
+        yield prefix
+        while group := list(itertools.islice(chunks, size)):
+            yield "".join(group).replace("\n", newline)
+
+    return iencode
+
+
+def _indent_prefix(indent):
+    return indent if isinstance(indent, str) else " " * (indent or 0)
+
+
+def _array_lines(strings):
+    """Generator yielding string lines that form a JSON array with the given encoded elements."""
+
+    it = iter(strings)
     yield "[\n"
-    obj = next(it, None)
-    if obj is not None:
-        yield textwrap.indent(encode(obj), prefix)
-    for obj in it:
-        yield ",\n"
-        yield textwrap.indent(encode(obj), prefix)
+    first = next(it, None)
+    if first is not None:
+        yield first
+        for string in it:
+            yield ",\n"
+            yield string
     yield "\n"
     yield "]"
 
 
-def idump_into(filename, iterable, encoding=ENCODING, **kwargs):
+def idump_into(filename, iterable, encoding=ENCODING, threads=None, index=False, size=1024 * 1024, **kwargs):
     """
     Dump an iterable incrementally into a JSON file.
     Use (`.gz`, `.xz`, `.bz2`) extensions to create compressed files.
+    Use "threads" to compress blocks in parallel, see `pymince.file.xopen`.
 
     The result will always be an array with the elements of the iterable.
     Useful to reduce memory consumption
 
+    The elements are encoded into a buffer that is written to the binary
+    (or compressed) stream in blocks of "size" bytes.
+
+    If "index" is true, a sidecar file (`<filename>.idx`) with the byte offsets of
+    each element (little-endian unsigned 64-bit integers) is also written, see `JSONArrayReader`.
+    Compressed files are then written as independent members that end at element boundaries.
+    The "index" option doesn't support "threads".
+
     Examples:
         from pymince.json import idump_into
 
@@ -185,13 +1134,252 @@ def idump_into(filename, iterable, encoding=ENCODING, **kwargs):
         idump_into("foo.json.gz", values)  # gzip-compressed
         idump_into("foo.json.xz", values)  # lzma-compressed
         idump_into("foo.json.bz2", values) # bz2-compressed
+        idump_into("foo.json.gz", values, threads=4)  # gzip-compressed in parallel
+        idump_into("foo.json.gz", values, index=True)  # gzip-compressed with "foo.json.gz.idx" index
+    """
+
+    if index:
+        if threads:
+            raise ValueError("'threads' is not supported with 'index'")
+        _idump_indexed(filename, iterable, encoding, kwargs, size=size)
+    else:
+        iencode = _make_iencoder(**kwargs)
+        encode = _file_encoder(encoding)
+        buffer = bytearray(encode("[\n"))
+        with pymince.file.xopen(filename, mode="wb", threads=threads) as f:
+            for i, obj in enumerate(iterable):
+                if i:
+                    buffer += encode(",\n")
+                for chunk in iencode(obj):
+                    buffer += encode(chunk)
+                    if len(buffer) >= size:
+                        f.write(buffer)
+                        buffer.clear()
+            buffer += encode("\n]")
+            f.write(buffer)
+
+
+def _file_encoder(encoding):
+    """
+    Return a function that encodes the consecutive strings written to a file,
+    the byte order mark of the encoding (if any) is only returned by the first call.
+    """
+
+    if codecs.lookup(encoding).name == "utf-8":
+        return str.encode  # Faster, without state.
+    else:
+        return codecs.getincrementalencoder(encoding)().encode
+
+
+def _idump_indexed(filename, iterable, encoding, dumps_kwargs, size):
+    """
+    Dump an iterable into a JSON array file and write its index.
+
+    The index holds three little-endian unsigned 64-bit integers for each element:
+    the offset of its compressed member (always 0 for uncompressed files), and
+    the start and stop offsets of the element inside the uncompressed member.
+    """
+
+    compress = pymince.file.compressors.get(os.path.splitext(filename)[1])
+    encode = _make_encoder(**dumps_kwargs)
+    to_bytes = _file_encoder(encoding)
+    offsets = array.array("Q")
+    member = base = 0
+    buffer = bytearray(to_bytes("[\n"))
+    with open(filename, mode="wb") as f:
+        for obj in iterable:
+            if offsets:
+                buffer += to_bytes(",\n")
+            start = base + len(buffer)
+            buffer += to_bytes(encode(obj))
+            offsets.extend((member, start, base + len(buffer)))
+            if len(buffer) >= size:
+                if compress:
+                    member += f.write(compress(buffer))  # Next elements go to a new member.
+                else:
+                    base += f.write(buffer)
+                buffer.clear()
+        buffer += to_bytes("\n]")
+        f.write(compress(buffer) if compress else buffer)
+
+    if sys.byteorder == "big":
+        offsets.byteswap()  # The index is little-endian on every host.
+    with open(os.fspath(filename) + INDEX_EXTENSION, mode="wb") as f:
+        offsets.tofile(f)
+
+
+def idump_sharded(
+    pattern,
+    iterable,
+    max_items=None,
+    max_bytes=None,
+    manifest=None,
+    encoding=ENCODING,
+    size=1024 * 1024,
+    **kwargs,
+):
+    """
+    Dump an iterable incrementally into JSON array files (shards) of at most
+    "max_items" elements and "max_bytes" bytes on disk.
+    Use (`.gz`, `.xz`, `.bz2`) extensions to create compressed files.
+
+    The shard names are given by "pattern" formatted with the shard number.
+    The elements are encoded only once, compressed shards are written
+    as independent members of "size" uncompressed bytes, so the size on disk
+    is known while writing. A shard always holds at least one element,
+    even if it exceeds "max_bytes". No shard is written for an empty iterable.
+
+    A manifest listing the name, the number of elements and the size in bytes
+    of each shard is written at the end, by default `manifest.json`
+    in the directory of the shards.
+
+    :param str pattern: Format string of the shard paths, i.e: "out-{:05d}.json.gz"
+    :param iterable: Iterable[dict]
+    :param int max_items: Maximum number of elements of each shard.
+    :param int max_bytes: Maximum size in bytes of each shard.
+    :param str manifest: Path of the manifest file.
+    :param str encoding: utf-8 is used by default.
+    :param int size: Size in bytes of the blocks written (compressed) at once.
+    :param kwargs: json.dumps kwargs.
+    :return: The manifest.
+    :rtype: list[dict]
+
+    Examples:
+        from pymince.json import idump_sharded
+
+        values = ({"key": n} for n in range(2500))
+
+        idump_sharded("out-{:05d}.json.gz", values, max_items=1000)
+        # --> [{"name": "out-00000.json.gz", "count": 1000, "size": 2174}, ..., {..., "count": 500, ...}]
+    """
+
+    if max_items is not None and max_items < 1:
+        raise ValueError("'max_items' must be greater than zero")
+
+    if manifest is None:
+        manifest = os.path.join(os.path.dirname(pattern), "manifest.json")
+
+    encode = _make_encoder(**kwargs)
+    writer = _ShardWriter(pattern, max_bytes, size, encoding)
+    for obj in iterable:
+        if writer.count == max_items:
+            writer.close()
+        writer.add(encode(obj))
+    writer.close()
+
+    dump_into(manifest, writer.shards, encoding=encoding, indent=2)
+    return writer.shards
+
+
+class _ShardWriter:
+    """
+    Write encoded elements into JSON array files, starting a new file
+    when the current one can't hold the next elements within "max_bytes".
+
+    Each file begins with the byte order mark of the encoding (if any),
+    the elements and the array delimiters are encoded without it.
     """
 
-    with pymince.file.xopen(filename, mode="wt", encoding=encoding) as f:
-        f.writelines(idump_lines(iterable, **kwargs))
+    def __init__(self, pattern, max_bytes, size, encoding):
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.size = size
+        self.compress = pymince.file.compressors.get(os.path.splitext(pattern)[1], bytes)
+        self.encode = _file_encoder(encoding)
+        self.opening = self.encode("") + self.encode("[\n")  # The first call returns the BOM.
+        self.separator = self.encode(",\n")
+        self.ending = self.encode("\n]")
+        self.closing = len(self.compress(self.ending))
+        self.shards = []
+        self.file = None
+        self.written = 0  # Bytes written to the current shard.
+        self.count = 0  # Elements of the current shard.
+        self.buffer = bytearray(self.opening)
+        self.marks = []  # Offsets of the buffered elements, including their separator.
+
+    def add(self, text):
+        self.marks.append(len(self.buffer))
+        if self.count:
+            self.buffer += self.separator
+        self.buffer += self.encode(text)
+        self.count += 1
+        while len(self.buffer) >= self.size:
+            self._flush(final=False)
+
+    def close(self):
+        while self.count:
+            self._flush(final=True)
+
+    def _flush(self, final):
+        # Keep room to close the array unless this is the last block.
+        block = self.compress(self.buffer + self.ending if final else self.buffer)
+        if self._fits(len(block) + (0 if final else self.closing)):
+            self._write(block)
+            self.buffer = bytearray(self.opening if final else b"")
+            self.marks = []
+            if final:
+                self._close_shard()
+            return
+
+        # Close the shard with the largest prefix of the buffered elements that fits,
+        # a shard holds at least one element.
+        lo = 1 if len(self.marks) == self.count else 0
+        hi = len(self.marks)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._fits(len(self.compress(self._prefix(mid)))):
+                lo = mid
+            else:
+                hi = mid - 1
+        self._write(self.compress(self._prefix(lo)))
+        remaining = len(self.marks) - lo
+        self.count -= remaining
+        self._close_shard()
+
+        # The remaining elements begin the next shard, without the separator of the first one.
+        if remaining:
+            cut = self.marks[lo]
+            rest = cut + len(self.separator)  # After the separator of the first element.
+            self.buffer = bytearray(self.opening) + self.buffer[rest:]
+            shift = len(self.opening) - rest
+            self.marks = [mark + shift for mark in self.marks[lo:]]
+            self.count = remaining
+        else:
+            self.buffer = bytearray(self.opening)
+            self.marks = []
+
+    def _fits(self, nbytes):
+        return self.max_bytes is None or self.written + nbytes <= self.max_bytes
+
+    def _prefix(self, n):
+        # Buffered bytes of the first "n" elements followed by the end of the array.
+        stop = self.marks[n] if n < len(self.marks) else len(self.buffer)
+        return self.buffer[:stop] + self.ending
+
+    def _write(self, block):
+        if self.file is None:
+            # Spans several "_write" calls, closed by "_close_shard".
+            self.file = open(self.pattern.format(len(self.shards)), mode="wb")  # noqa: SIM115
+        self.written += self.file.write(block)
 
+    def _close_shard(self):
+        self.file.close()
+        name = os.path.basename(self.file.name)
+        self.shards.append({"name": name, "count": self.count, "size": self.written})
+        self.file = None
+        self.written = 0
+        self.count = 0
 
-def idump_fork(path_items, encoding=ENCODING, dump_if_empty=True, **dumps_kwargs):
+
+def idump_fork(
+    path_items,
+    encoding=ENCODING,
+    dump_if_empty=True,
+    threads=None,
+    max_open=None,
+    background=False,
+    **dumps_kwargs,
+):
     """
     Incrementally dumps different groups of elements into
     the indicated JSON file.
@@ -201,6 +1389,18 @@ def idump_fork(path_items, encoding=ENCODING, dump_if_empty=True, **dumps_kwargs
     :param Iterable[file_path, Iterable[dict]] path_items: group items by file path
     :param encoding: 'utf-8' by default.
     :param bool dump_if_empty: If false, don't create an empty file.
+    :param int threads: Compress blocks in parallel, see `pymince.file.xopen`.
+    :param int max_open:
+        Maximum number of files open at the same time. If given, the least recently
+        used files are closed and reopened in append mode when they receive new elements,
+        compressed files become multi-member/multi-stream files.
+    :param background:
+        If true, elements are encoded by the caller while the compression and
+        the writing of the files are done by a background thread, or by the given
+        number of threads. Each thread has a bounded queue, so the caller waits when
+        the threads fall behind. Errors of the threads are raised in the caller.
+        With "max_open", the caller waits for a file to be closed by its thread
+        before another thread opens a file, so the limit holds.
     :param dumps_kwargs: json.dumps kwargs.
 
     Examples:
@@ -213,45 +1413,727 @@ def idump_fork(path_items, encoding=ENCODING, dump_if_empty=True, **dumps_kwargs
             ("baz.json", ()),
         )
         idump_fork(iter(path_items))
+        idump_fork(iter(path_items), max_open=1000)
+        idump_fork(iter(path_items), background=True)
     """
 
     def get_dumper(dst):
         nothing = True
-        with pymince.file.xopen(dst, mode="wt", encoding=encoding) as fd:
-            write = fd.write
-            write("[\n")
+        closing = False
+        mode = "wt"
+        obj = empty
+        while True:
+            with pymince.file.xopen(dst, mode=mode, encoding=encoding, threads=threads) as fd:
+                write = fd.write
+                if mode == "wt":
+                    write("[\n")
+                    mode = "at"
+                try:
+                    while not closing and obj is not suspend:
+                        if obj is not empty:
+                            if nothing:
+                                nothing = False
+                            else:
+                                write(",\n")
+                            write(obj)
+                        obj = yield
+                except GeneratorExit:
+                    closing = True
+                if closing:
+                    write("]") if nothing else write("\n]")
+                    break
             try:
-                while True:
-                    obj = yield
-                    if nothing:
-                        nothing = False
-                    else:
-                        write(",\n")
-                    write(textwrap.indent(encode(obj), prefix))
+                obj = yield  # Suspended, the file is reopened when a new element arrives.
             except GeneratorExit:
-                write("]") if nothing else write("\n]")
+                closing = True
 
         if nothing and not dump_if_empty:
             os.unlink(dst)
 
-    encode = functools.partial(json_dumps, **dumps_kwargs)
-    indent = dumps_kwargs.get("indent")
-    prefix = " " * indent if indent else ""
+    if max_open is not None and max_open < 1:
+        raise ValueError("'max_open' must be at least one")
+
+    empty = pymince._constants.empty
+    suspend = object()
+    encode = _make_encoder(**dumps_kwargs)
+
+    def call(key, fn, *args):
+        return fn(*args)
+
+    caller = _BackgroundCaller(1 if background is True else background) if background else call
 
     dumpers = dict()
-    for path, items in path_items:
-        if path in dumpers:
-            dumper = dumpers[path]
+    opened = collections.OrderedDict()  # Paths of open files, the least recently used first.
+    try:
+        for path, items in path_items:
+            if path in opened:
+                opened.move_to_end(path)
+            elif max_open:
+                if len(opened) >= max_open:
+                    lru_path = opened.popitem(last=False)[0]
+                    caller(lru_path, dumpers[lru_path].send, suspend)
+                    if background:
+                        caller.order(lru_path, path)  # Close it before opening "path" to keep the limit.
+                opened[path] = None
+
+            if path in dumpers:
+                dumper = dumpers[path]
+            else:
+                dumper = get_dumper(path)
+                caller(path, dumper.send, None)
+                dumpers[path] = dumper
+
+            for item in items:
+                caller(path, dumper.send, encode(item))
+        # Cleanup, open files first to keep the limit,
+        # suspended files are reopened to be closed one after the other.
+        previous = None
+        for path in itertools.chain(opened, dumpers):
+            if background and max_open and previous is not None:
+                caller.order(previous, path)
+            caller(path, dumpers[path].close)
+            previous = path
+    finally:
+        if background:
+            caller.close()
+
+
+class _BackgroundCaller:
+    """
+    Call functions in background threads with bounded queues.
+    Calls with the same key are done by the same thread in the calling order.
+    """
+
+    def __init__(self, threads, maxsize=1024):
+        if threads < 1:
+            raise ValueError("'background' must be at least one")
+
+        self.errors = []
+        self.queues = [queue.Queue(maxsize=maxsize) for _ in range(threads)]
+        self.threads = [threading.Thread(target=self.run, args=(q,), daemon=True) for q in self.queues]
+        for thread in self.threads:
+            thread.start()
+
+    def __call__(self, key, fn, *args):
+        if self.errors:
+            raise self.errors[0]
+        self.queues[hash(key) % len(self.queues)].put((fn, args))
+
+    def order(self, key, then):
+        """
+        Make the next calls with key "then" start after the calls already done with "key",
+        waiting for them if they are done by another thread.
+        """
+
+        tasks = self.queues[hash(key) % len(self.queues)]
+        if tasks is not self.queues[hash(then) % len(self.queues)]:
+            done = threading.Event()
+            tasks.put((done.set, ()))
+            while not (done.wait(0.1) or self.errors):  # Pending calls are discarded after an error.
+                pass
+        if self.errors:
+            raise self.errors[0]
+
+    def run(self, tasks):
+        while (task := tasks.get()) is not None:
+            if not self.errors:  # After an error, pending tasks are discarded to avoid blocking the caller.
+                fn, args = task
+                try:
+                    fn(*args)
+                except BaseException as e:
+                    self.errors.append(e)
+
+    def close(self):
+        """Wait for the pending calls, raise the first error of the threads."""
+
+        for tasks in self.queues:
+            tasks.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.errors:
+            raise self.errors[0]
+
+
+def idump_lines_ndjson(iterable, **dumps_kwargs):
+    """
+    Generator yielding the serialized elements of given iterable
+    as JSON Lines (NDJSON), one newline-terminated string per element.
+
+    :param iterable: Iterable[dict]
+    :param dumps_kwargs: json.dumps kwargs, "indent" is not allowed.
+    :rtype: Iterable[str]
+
+    Examples:
+        from pymince.json import idump_lines_ndjson
+
+        idump_lines_ndjson([{"a": 1}, {"b": 2}]) # --> '{"a": 1}\n' '{"b": 2}\n'
+    """
+
+    if dumps_kwargs.get("indent") is not None:
+        raise ValueError("JSON Lines does not support 'indent'")
+
+    encode = json_encoder(**dumps_kwargs)
+    for obj in iterable:
+        yield encode(obj) + "\n"
+
+
+def dump_ndjson_into(filename, iterable, encoding=ENCODING, batch=1024, threads=None, **kwargs):
+    """
+    Dump an iterable incrementally into a JSON Lines (NDJSON) file.
+    Use (`.gz`, `.xz`, `.bz2`) extensions to create compressed files.
+
+    Lines are joined in batches before being written to reduce the number of writes.
+    Useful to reduce memory consumption
+
+    :param str filename:
+    :param iterable: Iterable[dict]
+    :param str encoding: utf-8 is used by default.
+    :param int batch: Number of lines written at once. Default is 1024.
+    :param int threads: Compress blocks in parallel, see `pymince.file.xopen`.
+    :param kwargs: json.dumps kwargs, "indent" is not allowed.
+
+    Examples:
+        from pymince.json import dump_ndjson_into
+
+        values = ([{"key": "foo"}, {"key": "bar"}])
+
+        dump_ndjson_into("foo.jsonl", values)     # uncompressed
+        dump_ndjson_into("foo.jsonl.gz", values)  # gzip-compressed
+    """
+
+    lines = idump_lines_ndjson(iterable, **kwargs)
+    with pymince.file.xopen(filename, mode="wt", encoding=encoding, threads=threads) as fd:
+        write = fd.write
+        for group in pymince.iterator.grouper(lines, batch):
+            write("".join(group))
+
+
+def iload_lines(filename, encoding=ENCODING, size=1024 * 1024):
+    """
+    Make a generator that yields the elements of a JSON Lines (NDJSON) file.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions to load compressed files.
+
+    The file is read in blocks that are split into lines at once,
+    blank lines are ignored.
+    Useful to reduce memory consumption
+
+    :param str filename:
+    :param str encoding: utf-8 is used by default.
+    :param int size: Read up-to-size characters from file for each block. Default is 1MB.
+    :rtype: Generator
+
+    Examples:
+        from pymince.json import iload_lines
+
+        for item in iload_lines("foo.jsonl.gz"):
+            print(item)
+    """
+
+    decode = json_loads
+    tail = ""
+    with pymince.file.xopen(filename, mode="rt", encoding=encoding) as fd:
+        for chunk in iter(functools.partial(fd.read, size), ""):
+            lines = (tail + chunk).split("\n")
+            tail = lines.pop()  # Incomplete line, it's completed with the next block.
+            for line in lines:
+                if line and not line.isspace():
+                    yield decode(line)
+    if tail and not tail.isspace():
+        yield decode(tail)
+
+
+def sort_file(
+    src,
+    dst,
+    key=None,
+    reverse=False,
+    ndjson=False,
+    memory_limit=64 * 1024 * 1024,
+    workers=None,
+    encoding=ENCODING,
+    **kwargs,
+):
+    """
+    Sort the elements of a JSON array file (or JSON Lines file if "ndjson")
+    into another file of the same kind, without loading the whole file in memory.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions of both files.
+
+    The elements are read incrementally and sorted in runs of about "memory_limit"
+    bytes (measured as their compact JSON encoding). The runs are spilled to
+    temporary gzip-compressed JSON Lines files, that are merged with `heapq.merge`.
+    The sort is stable.
+
+    Use "workers" to sort and spill the runs in a pool of processes,
+    then up to "workers" runs are kept in memory at once and "key" must be picklable.
+
+    :param str src: Path of the file to sort.
+    :param str dst: Path of the sorted file.
+    :param key: Function of one argument that extracts the comparison key of each element.
+    :param bool reverse: Sort in descending order.
+    :param bool ndjson: Files are JSON Lines (NDJSON) files instead of JSON arrays.
+    :param int memory_limit: Approximate size in bytes of each run. Default is 64MB.
+    :param int workers: Number of processes to sort runs in parallel.
+    :param str encoding: utf-8 is used by default.
+    :param kwargs: json.dumps kwargs of the sorted file.
+
+    Examples:
+        import operator
+        from pymince.json import sort_file
+
+        sort_file("foo.json.gz", "sorted.json.gz", key=operator.itemgetter("id"))
+        sort_file("foo.jsonl", "sorted.jsonl", key=operator.itemgetter("id"), ndjson=True, workers=4)
+    """
+
+    items = iload_lines(src, encoding=encoding) if ndjson else iload_from(src, encoding=encoding)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = _isort_runs(items, key, memory_limit)
+        tasks = ((os.path.join(tmpdir, f"{i}.jsonl.gz"), run, reverse) for i, run in enumerate(runs))
+        if workers:
+            paths = list(pymince.iterator.pmap(_spill_run, tasks, workers=workers, backend="process", prefetch=workers))
+        else:
+            paths = list(map(_spill_run, tasks))
+
+        merged = _merge_runs(paths, tmpdir, key, reverse, memory_limit)
+        if ndjson:
+            dump_ndjson_into(dst, merged, encoding=encoding, **kwargs)
+        else:
+            idump_into(dst, merged, encoding=encoding, **kwargs)
+
+
+def _isort_runs(items, key, memory_limit):
+    """Generator yielding lists of (key, compact JSON) pairs of about "memory_limit" bytes."""
+
+    encode = json_encoder(separators=(",", ":"))
+    run = []
+    size = 0
+    for obj in items:
+        line = encode(obj)
+        run.append((key(obj) if key else obj, line))
+        size += len(line)
+        if size >= memory_limit:
+            yield run
+            run = []
+            size = 0
+    if run:
+        yield run
+
+
+def _spill_run(task):
+    """Sort a run and write its elements into a JSON Lines file."""
+
+    path, run, reverse = task
+    run.sort(key=operator.itemgetter(0), reverse=reverse)
+    with pymince.file.xopen(path, mode="wt", encoding=ENCODING) as f:
+        f.writelines(line + "\n" for _, line in run)
+    return path
+
+
+def _merge_runs(paths, tmpdir, key, reverse, memory_limit, fan_in=128):
+    """
+    Return an iterator that merges the sorted runs,
+    runs are merged first in groups of "fan_in" files to limit the opened files.
+    """
+
+    # Each opened run reads blocks of at most 1MB, all together about "memory_limit" bytes.
+    size = max(64 * 1024, min(1024 * 1024, memory_limit // fan_in))
+    while len(paths) > fan_in:
+        groups = pymince.iterator.grouper(paths, fan_in)
+        paths = [_merge_group(tuple(group), tmpdir, key, reverse, size) for group in groups]
+    iterables = (iload_lines(path, size=size) for path in paths)
+    return heapq.merge(*iterables, key=key, reverse=reverse)
+
+
+def _merge_group(paths, tmpdir, key, reverse, size):
+    fd, merged_path = tempfile.mkstemp(suffix=".jsonl.gz", dir=tmpdir)
+    os.close(fd)
+    iterables = (iload_lines(path, size=size) for path in paths)
+    dump_ndjson_into(merged_path, heapq.merge(*iterables, key=key, reverse=reverse), separators=(",", ":"))
+    for path in paths:
+        os.remove(path)
+    return merged_path
+
+
+def dedupe_file(
+    src,
+    dst,
+    key=None,
+    ndjson=False,
+    memory_limit=64 * 1024 * 1024,
+    partitions=64,
+    encoding=ENCODING,
+    **kwargs,
+):
+    """
+    Write the elements of a JSON array file (or JSON Lines file if "ndjson")
+    into another file of the same kind, keeping only the first element with each key.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions of both files.
+
+    The seen keys are kept in memory up to about "memory_limit" bytes, then the
+    remaining elements are hash-partitioned by key into temporary files that
+    are deduplicated one at a time, and merged back preserving the input order.
+
+    :param str src: Path of the file to deduplicate.
+    :param str dst: Path of the deduplicated file.
+    :param key: Function of one argument that extracts the key of each element,
+    by default the elements are compared by their JSON encoding.
+    :param bool ndjson: Files are JSON Lines (NDJSON) files instead of JSON arrays.
+    :param int memory_limit: Approximate size in bytes of the keys kept in memory. Default is 64MB.
+    :param int partitions: Number of temporary files that the remaining elements are split into.
+    :param str encoding: utf-8 is used by default.
+    :param kwargs: json.dumps kwargs of the deduplicated file.
+
+    Examples:
+        import operator
+        from pymince.json import dedupe_file
+
+        dedupe_file("foo.json.gz", "unique.json.gz", key=operator.itemgetter("id"))
+        dedupe_file("foo.jsonl", "unique.jsonl", ndjson=True)
+    """
+
+    items = iload_lines(src, encoding=encoding) if ndjson else iload_from(src, encoding=encoding)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        uniques = _idedupe(items, key, memory_limit, partitions, tmpdir)
+        if ndjson:
+            dump_ndjson_into(dst, uniques, encoding=encoding, **kwargs)
         else:
-            dumper = get_dumper(path)
-            dumper.send(None)
-            dumpers[path] = dumper
+            idump_into(dst, uniques, encoding=encoding, **kwargs)
+
+
+def _idedupe(items, key, memory_limit, partitions, tmpdir):
+    """
+    Generator yielding the first element with each key, spilling the elements
+    to "partitions" files once the seen keys exceed "memory_limit" bytes.
+    """
+
+    encode = json_encoder(separators=(",", ":"))
+    get = key or json_encoder(separators=(",", ":"), sort_keys=True)
+    seen = set()
+    size = 0
+    for obj in items:
+        check = get(obj)
+        if check not in seen:
+            seen.add(check)
+            size += sys.getsizeof(check) + 64  # Approximate size of the set entry.
+            yield obj
+            if size >= memory_limit:
+                break
+    else:
+        return
+
+    # The elements are spilled with their sequence number as "[seq,obj]" lines.
+    paths = [os.path.join(tmpdir, f"{i}.jsonl") for i in range(partitions)]
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open(path, mode="w", encoding=ENCODING)) for path in paths]
+        for seq, obj in enumerate(items):
+            check = get(obj)
+            if check not in seen:
+                files[hash(check) % partitions].write(f"[{seq},{encode(obj)}]\n")
+    seen.clear()
+
+    for path in paths:
+        _dedupe_partition(path, get, encode)
+    merged = heapq.merge(*map(iload_lines, paths), key=operator.itemgetter(0))
+    yield from map(operator.itemgetter(1), merged)
+
+
+def _dedupe_partition(path, get, encode):
+    """Rewrite a partition file keeping the first element with each key."""
+
+    uniques = pymince.iterator.uniquer(iload_lines(path), key=lambda pair: get(pair[1]))
+    with open(path + ".tmp", mode="w", encoding=ENCODING) as f:
+        f.writelines(f"[{seq},{encode(obj)}]\n" for seq, obj in uniques)
+    os.replace(path + ".tmp", path)
+
+
+def concat_files(srcs, dst, threads=None, size=1024 * 1024):
+    """
+    Concatenate JSON array files into a JSON array file with all their elements.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions of all the files.
+
+    The elements are not decoded, the content between the brackets of each
+    file is copied as is, so the layout of `idump_into` files is kept.
+
+    :param srcs: Paths of the JSON array files.
+    :param str dst: Path of the concatenated file.
+    :param int threads: Compress blocks in parallel, see `pymince.file.xopen`.
+    :param int size: Size in bytes of the blocks read at once. Default is 1MB.
+
+    Examples:
+        from pymince.json import concat_files
+
+        concat_files(["foo-0.json.gz", "foo-1.json.gz"], "foo.json.gz")
+    """
+
+    with pymince.file.xopen(dst, mode="wb", threads=threads) as out:
+        out.write(b"[\n")
+        empty = True
+        for src in srcs:
+            with pymince.file.xopen(src, mode="rb") as f:
+                for i, block in enumerate(_iarray_body(f, size)):
+                    if i == 0 and not empty:
+                        out.write(b",\n")
+                    out.write(block)
+                    empty = False
+        out.write(b"\n]")
+
+
+def _iarray_body(f, size):
+    """
+    Generator yielding the blocks of a binary JSON array stream between its brackets,
+    without the surrounding whitespace. Nothing is yielded for an empty array.
+    """
+
+    blocks = iter(functools.partial(f.read, size), b"")
+    held = next((block.lstrip() for block in blocks if not block.isspace()), b"")
+    if not held.startswith(b"["):
+        raise ValueError("The file is not a JSON array")
+
+    # The last non-whitespace byte and the whitespace around it are held back,
+    # it may be the closing bracket.
+    held = held[1:]
+    first = True
+    for block in itertools.chain((b"",), blocks):
+        data = held + block
+        body = data.rstrip()[:-1].rstrip()
+        if body:
+            kept = len(body)
+            held = data[kept:]
+            if first:
+                # Skip the lines before the first element, but keep its indentation.
+                line = body.rfind(b"\n", 0, len(body) - len(body.lstrip())) + 1
+                body = body[line:]
+                first = False
+            yield body
+        else:
+            held = data
+
+    if held.strip() != b"]":
+        raise ValueError("The file is not a JSON array")
+
+
+def split_file(src, n, pattern=None, threads=None, size=1024 * 1024):
+    """
+    Split a JSON array file into "n" JSON array files of similar size.
+    Recognizes (`.gz`, `.xz`, `.bz2`) extensions of all the files.
+    A compressed "src" is read once, the files are balanced by its compressed bytes.
 
-        for item in items:
-            dumper.send(item)
-    # Cleanup
-    for dumper in dumpers.values():
-        dumper.close()
+    The elements are not decoded, a scanner of brackets and quotes finds the
+    lines where the top-level elements end, and their bytes are copied as is.
+    Elements are cut at the end of lines, as the files written by `idump_into`
+    or with "indent", so a JSON array written on a single line is not split.
+
+    :param str src: Path of the JSON array file.
+    :param int n: Number of files.
+    :param str pattern: Format string of the paths of the files, given the file number.
+    By default, the name of "src" with the file number, i.e: "foo-{}.json.gz"
+    :param int threads: Compress blocks in parallel, see `pymince.file.xopen`.
+    :param int size: Size in bytes of the blocks written at once. Default is 1MB.
+    :return: Paths of the files.
+    :rtype: list[str]
+
+    Examples:
+        from pymince.json import split_file
+
+        split_file("foo.json.gz", 4) # --> ["foo-0.json.gz", "foo-1.json.gz", "foo-2.json.gz", "foo-3.json.gz"]
+    """
+
+    if n < 1:
+        raise ValueError("'n' must be greater than zero")
+
+    if pattern is None:
+        root, ext = os.path.splitext(src)
+        if ext in pymince.file.openers:
+            root, inner = os.path.splitext(root)
+            ext = inner + ext
+        pattern = root.replace("{", "{{").replace("}", "}}") + "-{}" + ext
+
+    # The files are balanced by the bytes consumed from "src" (compressed bytes if it is compressed),
+    # except for small compressed files, that the decompressor reads ahead by whole parts.
+    opener = pymince.file.openers.get(os.path.splitext(src)[1])
+    paths = [pattern.format(i) for i in range(n)]
+    with open(src, mode="rb") as raw, (opener(raw, mode="rb") if opener else contextlib.nullcontext(raw)) as f:
+        total = os.fstat(raw.fileno()).st_size
+        measured = opener is not None and total < n * 64 * 1024
+        if measured:
+            total = sum(map(len, iter(functools.partial(f.read, size), b"")))
+            f.seek(0)
+
+        chunks = _iarray_chunks(f, max(1, total // n // 64))
+        chunk = next(chunks, None)
+        written = 0
+        for i, path in enumerate(paths, start=1):
+            with pymince.file.xopen(path, mode="wb", threads=threads) as out:
+                buffer = bytearray(b"[\n")
+                separator = b""
+                while chunk is not None and ((written if measured else raw.tell()) < total * i / n or i == n):
+                    buffer += separator
+                    buffer += chunk
+                    written += len(separator) + len(chunk)
+                    separator = b",\n"
+                    chunk = next(chunks, None)
+                    if len(buffer) >= size:
+                        out.write(buffer)
+                        buffer.clear()
+                buffer += b"\n]"
+                out.write(buffer)
+    return paths
+
+
+def _iarray_chunks(f, size):
+    """
+    Generator yielding the raw bytes of the top-level elements of a binary JSON array
+    stream, grouped by the lines where they end (up to about "size" bytes of lines
+    holding whole elements), without the trailing comma.
+    """
+
+    first = b" "
+    while first.isspace():
+        first = f.readline()
+    first = first.lstrip()
+    if not first.startswith(b"["):
+        raise ValueError("The file is not a JSON array")
+
+    depth = 1
+    parts = []
+    batches = itertools.chain(([first[1:]],), iter(functools.partial(f.readlines, size), []))
+    for batch in batches:
+        if depth == 1 and _balanced_lines(block := b"".join(batch)):
+            # Fast path, each line holds whole elements (i.e. `idump_into` without indent).
+            yield from _strip_chunk(block)
+            continue
+
+        for line in batch:
+            # JSON strings never contain a raw newline, so each line holds whole strings.
+            outside = _outside_strings(line)
+            depth += outside.count(b"[") + outside.count(b"{") - outside.count(b"]") - outside.count(b"}")
+            parts.append(line.rstrip()[:-1] if depth == 0 else line)  # Without the closing bracket.
+            if depth <= 1:
+                yield from _strip_chunk(b"".join(parts))
+                parts.clear()
+            if depth == 0:
+                return
+    raise ValueError("The file is not a JSON array")
+
+
+def _strip_chunk(chunk):
+    # Yield the chunk without the surrounding commas and blank lines, keeping the indentation.
+    chunk = chunk.rstrip()
+    chunk = chunk[:-1].rstrip() if chunk.endswith(b",") else chunk
+    stripped = chunk.lstrip()
+    if stripped.startswith(b","):
+        chunk = stripped = stripped[1:]
+    if stripped:
+        line = chunk.rfind(b"\n", 0, len(chunk) - len(stripped)) + 1
+        yield chunk[line:]
+
+
+def _balanced_lines(block):
+    """Return True if each line of JSON has balanced brackets."""
+
+    brackets = _outside_strings(block).translate(None, non_brackets)
+    while (reduced := brackets.replace(b"[]", b"").replace(b"{}", b"")) != brackets:
+        brackets = reduced
+    return not brackets.strip(b"\n")
+
+
+def _outside_strings(line):
+    """Return the bytes of a line of JSON outside its strings."""
+
+    if b"\\" in line:
+        # Escaped backslashes first, then escaped quotes.
+        line = line.replace(b"\\\\", b"__").replace(b'\\"', b"__")
+    return b"".join(line.split(b'"')[::2])
+
+
+class JSONArrayReader:
+    """
+    Random access to the elements of a JSON array file dumped
+    by `idump_into` with "index=True", it supports `len()`, indexing and slicing.
+    Elements are read by seeking directly to their offsets, the little-endian index
+    is memory-mapped (or loaded and byte-swapped on big-endian hosts).
+
+    :param str filename:
+    :param str encoding: utf-8 is used by default.
+
+    Examples:
+        from pymince.json import JSONArrayReader, idump_into
+
+        idump_into("foo.json.gz", ({"value": n} for n in range(1000)), index=True)
+
+        with JSONArrayReader("foo.json.gz") as reader:
+            len(reader)  # --> 1000
+            reader[10]   # --> {"value": 10}
+            reader[-1]   # --> {"value": 999}
+            reader[5:7]  # --> [{"value": 5}, {"value": 6}]
+    """
+
+    def __init__(self, filename, encoding=ENCODING):
+        self.filename = filename
+        self.encoding = encoding
+        self._opener = pymince.file.openers.get(os.path.splitext(filename)[1])
+        self._member = None
+        self._stream = None
+
+        with open(os.fspath(filename) + INDEX_EXTENSION, mode="rb") as f:
+            if sys.byteorder == "big":
+                self._mmap = None
+                offsets = array.array("Q", f.read())
+                offsets.byteswap()
+                self._offsets = memoryview(offsets)
+            else:
+                empty_index = not os.fstat(f.fileno()).st_size
+                self._mmap = None if empty_index else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._offsets = memoryview(self._mmap or b"").cast("Q")
+        self._raw = open(filename, mode="rb")  # noqa: SIM115 Owned by the reader, closed by "close".
+
+    def __len__(self):
+        return len(self._offsets) // 3
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[n] for n in range(*key.indices(len(self)))]
+
+        n = operator.index(key)
+        size = len(self)
+        if n < 0:
+            n += size
+        if not 0 <= n < size:
+            raise IndexError("JSONArrayReader index out of range")
+
+        begin, end = (n * 3, n * 3 + 3)
+        member, start, stop = self._offsets[begin:end]
+        return json_loads(self._read(member, start, stop).decode(self.encoding))
+
+    def __iter__(self):
+        for n in range(len(self)):
+            yield self[n]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._offsets.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._stream is not None:
+            self._stream.close()
+        self._raw.close()
+
+    def _read(self, member, start, stop):
+        if self._opener is None:
+            self._raw.seek(start)
+            return self._raw.read(stop - start)
+
+        # Reuse the decompressed stream for forward reads in the same member.
+        if self._member != member or self._stream.tell() > start:
+            self._raw.seek(member)
+            self._stream = self._opener(self._raw, mode="rb")
+            self._member = member
+        self._stream.seek(start)
+        return self._stream.read(stop - start)
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -262,19 +2144,78 @@ class JSONEncoder(json.JSONEncoder):
     - `datetime` and `date` are serialized to strings according to the isoformat.
     - `decimal.Decimal` is serialized to a string.
     - `uuid.UUID` is serialized to a string.
-    - `dataclasses.dataclass` is passed to `dataclasses.asdict`.
+    - `dataclasses.dataclass` is serialized to a dict with its fields (non-recursive copy).
     - `frozenset` and `set` are serialized by ordering their values.
+    - `enum.Enum` is serialized to its value.
+    - `pathlib.PurePath` is serialized to a string.
+    - `bytes` and `bytearray` are serialized to a base64 string.
+    - `array.array` and `memoryview` are serialized to a list.
+
+    The converter of each type is resolved once through its MRO and cached.
+    Use `JSONEncoder.register` to support other types, subclasses have their own registry.
+
+    Examples:
+        from pymince.json import JSONEncoder
+
+        JSONEncoder.register(complex, lambda c: [c.real, c.imag])
+        JSONEncoder().encode({"complex": 1 + 2j}) # --> '{"complex": [1.0, 2.0]}'
     """
 
+    converters = {
+        datetime.date: operator.methodcaller("isoformat"),
+        frozenset: sorted,
+        set: sorted,
+        decimal.Decimal: str,
+        uuid.UUID: str,
+        enum.Enum: operator.attrgetter("value"),
+        pathlib.PurePath: str,
+        bytes: lambda b: base64.b64encode(b).decode("ascii"),
+        bytearray: lambda b: base64.b64encode(b).decode("ascii"),
+        array.array: operator.methodcaller("tolist"),
+        memoryview: operator.methodcaller("tolist"),
+    }
+    _dispatch = dict()  # Cache of resolved converters by type.
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.converters = dict(cls.converters)
+        cls._dispatch = dict()
+
+    @classmethod
+    def register(cls, kind, fn):
+        """
+        Register the function that converts the instances of "kind"
+        and its subclasses into serializable objects.
+        """
+
+        cls.converters[kind] = fn
+        cls._dispatch.clear()
+        _encoders.clear()  # The backend may handle these types differently.
+
+    @classmethod
+    def resolve(cls, kind):
+        """Return the converter of the given type, or None if it is not supported."""
+
+        try:
+            return cls._dispatch[kind]
+        except KeyError:
+            pass
+
+        fn = next((cls.converters[klass] for klass in kind.__mro__ if klass in cls.converters), None)
+        if fn is None and dataclasses.is_dataclass(kind):
+            names = tuple(field.name for field in dataclasses.fields(kind))
+            fn = functools.partial(_dataclass_to_dict, names)
+        cls._dispatch[kind] = fn
+        return fn
+
     def default(self, obj):
-        if isinstance(obj, datetime.date):
-            return obj.isoformat()
-        elif isinstance(obj, (frozenset, set)):
-            return sorted(obj)
-        elif isinstance(obj, (decimal.Decimal, uuid.UUID)):
-            return str(obj)
-        elif dataclasses.is_dataclass(obj):
-            return dataclasses.asdict(obj)
-        else:
+        fn = self.resolve(type(obj))
+        if fn is None:
             # Let the base class default method raise the TypeError
             return super().default(obj)
+        else:
+            return fn(obj)
+
+
+def _dataclass_to_dict(names, obj):
+    return {name: getattr(obj, name) for name in names}
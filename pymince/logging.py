@@ -2,9 +2,10 @@
 
 """Logging utilities."""
 
-import json
 import logging
 
+import pymince.json
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -34,7 +35,8 @@ class StructuredFormatter(logging.Formatter):
         {"timestamp":"2022-06-17 18:37:48,789","level":"DEBUG","payload":{"string":"value2","number":2}}
     """
 
-    json_dumper = json.JSONEncoder(separators=(",", ":")).encode  # Most compact form
+    # Most compact form, uses the backend selected with `pymince.json.use_backend`.
+    json_dumper = pymince.json._BackendEncoder(separators=(",", ":"), ensure_ascii=True)
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+async def slow(values, delay):
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+@pytest.mark.parametrize("n", (-1, 0))
+def test_grouper_invalid(n):
+    with pytest.raises(ValueError):
+        collect(pymince.aiterator.grouper(agen((1, 2, 3)), n))
+
+
+@pytest.mark.parametrize(
+    "n,expected",
+    [
+        (1, [(1,), (2,), (3,)]),
+        (2, [(1, 2), (3,)]),
+        (5, [(1, 2, 3)]),
+    ],
+)
+@pytest.mark.parametrize("max_delay", (None, 10))
+def test_grouper(n, expected, max_delay):
+    result = pymince.aiterator.grouper(agen((1, 2, 3)), n, max_delay=max_delay)
+    assert collect(result) == expected
+
+
+def test_grouper_empty():
+    assert collect(pymince.aiterator.grouper(agen(()), 2, max_delay=1)) == []
+
+
+def test_grouper_max_delay():
+    result = pymince.aiterator.grouper(slow(range(6), 0.04), 100, max_delay=0.1)
+    groups = collect(result)
+    assert 2 <= len(groups) <= 4
+    assert [value for group in groups for value in group] == list(range(6))
+
+
+def test_grouper_max_delay_does_not_wait_next_element():
+    async def stalled():
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    async def main():
+        groups = pymince.aiterator.grouper(stalled(), 100, max_delay=0.01)
+        first = await asyncio.wait_for(groups.__anext__(), 1)
+        await groups.aclose()
+        return first
+
+    assert asyncio.run(main()) == (1,)
+
+
+@pytest.mark.parametrize("max_delay", (None, 10))
+def test_grouper_source_error(max_delay):
+    async def failing():
+        yield 1
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        collect(pymince.aiterator.grouper(failing(), 5, max_delay=max_delay))
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("data", ((1, 2, 3), ()))
+def test_ibool(data):
+    async def main():
+        it = pymince.aiterator.ibool(agen(data))
+        first = await it.has_next()
+        second = await it.has_next()
+        return first, second, [value async for value in it], await it.has_next()
+
+    assert asyncio.run(main()) == (bool(data), bool(data), list(data), False)
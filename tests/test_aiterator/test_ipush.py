@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+def test_ipush():
+    it = pymince.aiterator.ipush(agen((2, 3)))
+    it.append(4)
+    it.append(5)
+    it.prepend(1)
+    it.prepend(0)
+    assert collect(it) == [0, 1, 2, 3, 4, 5]
+
+
+def test_ipush_after_consumed():
+    async def main():
+        it = pymince.aiterator.ipush(agen((1,)))
+        values = [value async for value in it]
+        it.append(2)
+        it.prepend(0)
+        return values + [value async for value in it]
+
+    assert asyncio.run(main()) == [1, 0, 2]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "data,length,expected",
+    [
+        (("a", "b"), 3, ["a", "b", None]),
+        (("a", "b", "c"), 3, ["a", "b", "c"]),
+        (("a", "b", "c"), 1, ["a", "b", "c"]),
+        ((), 2, [None, None]),
+    ],
+)
+def test_pad_end(data, length, expected):
+    assert collect(pymince.aiterator.pad_end(agen(data), length)) == expected
+
+
+def test_pad_end_fill_value():
+    assert collect(pymince.aiterator.pad_end(agen(("a",)), 2, fill_value="1")) == ["a", "1"]
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "count,expected",
+    [
+        (-1, [None, 2, 3, None, 2, 3]),
+        (0, [1, 2, 3, 1, 2, 3]),
+        (1, [None, 2, 3, 1, 2, 3]),
+    ],
+)
+def test_replacer(count, expected):
+    result = pymince.aiterator.replacer(agen([1, 2, 3, 1, 2, 3]), lambda n: n == 1, None, count=count)
+    assert collect(result) == expected
+
+
+def test_replacer_given_iterable():
+    result = pymince.aiterator.replacer([1, 2], lambda n: n == 2, 0)
+    assert collect(result) == [1, 0]
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+import pymince.iterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "data,maxsplit,expected",
+    [
+        (("a", "b", "c", "d", "b", "e"), -1, [("a",), ("c", "d"), ("e",)]),
+        (("a", "b", "c", "d", "b", "e"), 1, [("a",), ("c", "d", "b", "e")]),
+        (("a", "b", "c"), 0, [("a", "b", "c")]),
+        (("b", "a", "b", "b", "c", "b"), -1, [(), ("a",), (), ("c",)]),
+        ((), -1, []),
+    ],
+)
+def test_splitter(data, maxsplit, expected):
+    result = pymince.aiterator.splitter(agen(data), "b", maxsplit=maxsplit)
+    assert collect(result) == expected
+
+
+def test_splitter_same_as_iterator():
+    data = ("b", "a", "b", "b", "c", "b", "d")
+    for maxsplit in range(-1, 5):
+        expected = list(pymince.iterator.splitter(data, "b", maxsplit=maxsplit))
+        assert collect(pymince.aiterator.splitter(agen(data), "b", maxsplit=maxsplit)) == expected
+
+
+def test_splitter_given_key_and_container():
+    result = pymince.aiterator.splitter(agen(("a", "B", "c")), "b", key=str.lower, container=list)
+    assert collect(result) == [["a"], ["c"]]
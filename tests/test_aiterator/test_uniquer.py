@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+import pymince.aiterator
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+def collect(aiterable):
+    async def main():
+        return [value async for value in aiterable]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ((1, 1, 3), [1, 3]),
+        ((1, 3, 1), [1, 3]),
+        ((), []),
+    ],
+)
+def test_uniquer(data, expected):
+    assert collect(pymince.aiterator.uniquer(agen(data))) == expected
+
+
+def test_uniquer_given_key():
+    data = ({"id": 1, "name": "n1"}, {"id": 2, "name": "n1"}, {"id": 3, "name": "n2"})
+    result = pymince.aiterator.uniquer(agen(data), key=lambda obj: obj["name"])
+    assert collect(result) == [{"id": 1, "name": "n1"}, {"id": 3, "name": "n2"}]
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("window", [1, 2, 3, 1]),
+        ("bloom", [1, 2, 3]),
+    ],
+)
+def test_uniquer_bounded_modes(mode, expected):
+    result = pymince.aiterator.uniquer(agen((1, 2, 2, 3, 1)), mode=mode, capacity=2)
+    assert collect(result) == expected
+
+
+def test_uniquer_invalid_mode():
+    with pytest.raises(ValueError):
+        collect(pymince.aiterator.uniquer(agen((1, 2)), mode="foo", capacity=2))
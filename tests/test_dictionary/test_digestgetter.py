@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import datetime
-import enum
 
 import pytest
 
@@ -59,9 +58,6 @@ def test_digest_with_value_error():
 
 
 def test_digest_type_error():
-    class MyEnum(enum.Enum):
-        a = "abc"
-
     getter = pymince.dictionary.DigestGetter()
     with pytest.raises(TypeError):
-        getter({"uuid": MyEnum.a})
+        getter({"object": object()})
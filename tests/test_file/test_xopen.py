@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pytest
+
+import pymince.file
+
+EXTENSIONS = (".txt.gz", ".txt.bz2", ".txt.xz", ".txt")
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_text_mode(extension):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"foo{extension}")
+        with pymince.file.xopen(path, mode="wt") as f:
+            f.write("ñó")
+        with pymince.file.xopen(path, mode="rt") as f:
+            assert f.read() == "ñó"
+
+
+@pytest.mark.parametrize("threads", (1, 4))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_threads_text_mode(extension, threads):
+    text = "".join(f"line ñó {n}\n" for n in range(10000))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"foo{extension}")
+        with pymince.file.xopen(path, mode="wt", threads=threads) as f:
+            f.write(text)
+        with pymince.file.xopen(path, mode="rt") as f:
+            assert f.read() == text
+
+
+@pytest.mark.parametrize("extension", (".gz", ".bz2", ".xz"))
+def test_threads_binary_mode_in_blocks(extension):
+    data = os.urandom(1024) * 100
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"foo{extension}")
+        compress = pymince.file.xopen(path, mode="wb", threads=2)
+        compress.block_size = 1000  # Force multiple members
+        with compress as f:
+            for n in range(0, len(data), 333):
+                end = n + 333
+                f.write(data[n:end])
+        with pymince.file.xopen(path, mode="rb") as f:
+            assert f.read() == data
+
+
+@pytest.mark.parametrize("extension", (".gz", ".bz2", ".xz"))
+def test_threads_append_mode(extension):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"foo{extension}")
+        with pymince.file.xopen(path, mode="wt", threads=2) as f:
+            f.write("foo")
+        with pymince.file.xopen(path, mode="at", threads=2) as f:
+            f.write("var")
+        with pymince.file.xopen(path, mode="rt") as f:
+            assert f.read() == "foovar"
+
+
+@pytest.mark.parametrize("extension", (".gz", ".bz2", ".xz"))
+def test_threads_empty(extension):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"foo{extension}")
+        with pymince.file.xopen(path, mode="wb", threads=2):
+            pass
+        with pymince.file.xopen(path, mode="rb") as f:
+            assert f.read() == b""
+
+
+def test_threads_write_on_closed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "foo.gz")
+        f = pymince.file.xopen(path, mode="wb", threads=2)
+        f.close()
+        f.close()  # Idempotent
+        with pytest.raises(ValueError):
+            f.write(b"foo")
+
+
+def test_threads_invalid():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "foo.gz")
+        with pytest.raises(ValueError):
+            pymince.file.ParallelWriter(path, bytes, 0)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import operator
 
+import pytest
+
 import pymince.iterator
 
 
@@ -28,3 +30,54 @@ def test_all_distinct_true_given_itemgetter():
         {"id": 2, "name": "n2"},
     )
     assert pymince.iterator.all_distinct(data, key=getter)
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ((1, 2, 1), False),
+        ((3, 1, 2), True),
+        ((), True),
+        (([1], [2], [1]), False),
+        (([1], [2], [3]), True),
+        ((1, [1], 2, 1), False),
+        ((1, [1], 2), True),
+        (({"a": 1}, {"a": 2}, {"a": 1}), False),
+        (({"a": 1}, {"a": 2}), True),
+        (({1}, {2}, {1}), False),
+        (({1}, {1, 2}, {2}, {1, 2}), False),
+        (({1}, {1, 2}, {2}), True),
+        (([{1}], [{2}], [{1}]), False),
+    ],
+)
+def test_all_distinct_non_adjacent(data, expected):
+    assert pymince.iterator.all_distinct(data) is expected
+
+
+def test_all_distinct_early_exit():
+    data = iter((1, 2, 1, 3, 4))
+    assert not pymince.iterator.all_distinct(data)
+    assert list(data) == [3, 4]
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ((1, 1, 2), False),
+        ((1, 2, 3), True),
+        ((1, 2, 1), True),
+        (([1], [1]), False),
+    ],
+)
+def test_all_distinct_presorted(data, expected):
+    assert pymince.iterator.all_distinct(data, presorted=True) is expected
+
+
+def test_all_distinct_key_error():
+    def key(val):
+        if val == 3:
+            raise TypeError(val)
+        return val
+
+    with pytest.raises(TypeError):
+        pymince.iterator.all_distinct((1, 2, 3), key=key)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import pymince.iterator
+
+
+@pytest.mark.parametrize(
+    "data,max_weight,expected",
+    [
+        ((), 4, ()),
+        (("ab", "cd", "e", "fghi", "j"), 4, (("ab", "cd"), ("e",), ("fghi",), ("j",))),
+        (("a", "b", "c"), 10, (("a", "b", "c"),)),
+        (("abcdef", "a", "abcdef"), 4, (("abcdef",), ("a",), ("abcdef",))),
+        (("", "", "a"), 1, (("", "", "a"),)),
+    ],
+)
+def test_grouper_by_weight(data, max_weight, expected):
+    groups = pymince.iterator.grouper_by_weight(iter(data), max_weight)
+    assert tuple(groups) == expected
+
+
+def test_grouper_by_weight_max_items():
+    groups = pymince.iterator.grouper_by_weight(range(1, 8), 10, weight=int, max_items=2)
+    assert tuple(groups) == ((1, 2), (3, 4), (5,), (6,), (7,))
+
+
+def test_grouper_by_weight_yields_eagerly():
+    data = iter((b"ab", b"cd", b"ef"))
+    groups = pymince.iterator.grouper_by_weight(data, 4)
+    assert next(groups) == (b"ab", b"cd")
+    assert next(data) == b"ef"
+
+
+def test_grouper_by_weight_keeps_items():
+    data = [[1], [2, 3]]
+    (group,) = pymince.iterator.grouper_by_weight(data, 10)
+    assert all(a is b for a, b in zip(group, data))
+
+
+@pytest.mark.parametrize("kwargs", ({"max_weight": 0}, {"max_weight": 1, "max_items": 0}))
+def test_grouper_by_weight_invalid(kwargs):
+    with pytest.raises(ValueError):
+        tuple(pymince.iterator.grouper_by_weight([1], **kwargs))
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import itertools
+import operator
+import threading
+import time
+
+import pytest
+
+import pymince.iterator
+
+
+def fail_on_three(n):
+    if n == 3:
+        raise ZeroDivisionError(n)
+    return n
+
+
+@pytest.mark.parametrize("chunksize", (1, 3, 100))
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_pmap_ordered(backend, chunksize):
+    result = pymince.iterator.pmap(operator.neg, range(50), workers=2, backend=backend, chunksize=chunksize)
+    assert list(result) == [-n for n in range(50)]
+
+
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_pmap_unordered(backend):
+    result = pymince.iterator.pmap(operator.neg, range(50), workers=2, backend=backend, ordered=False)
+    assert sorted(result) == sorted(-n for n in range(50))
+
+
+def test_pmap_yields_as_completed():
+    def sleep(n):
+        time.sleep(n)
+        return n
+
+    result = pymince.iterator.pmap(sleep, (0.2, 0), workers=2, ordered=False)
+    assert list(result) == [0, 0.2]
+
+
+def test_pmap_empty():
+    assert list(pymince.iterator.pmap(operator.neg, [])) == []
+
+
+def test_pmap_is_lazy():
+    prefetch = 4
+    consumed = itertools.count()
+    data = (next(consumed) for _ in range(100))
+    result = pymince.iterator.pmap(operator.neg, data, workers=2, prefetch=prefetch)
+    assert next(result) == 0
+    assert next(consumed) <= prefetch + 1
+    result.close()
+
+
+def test_pmap_bounded_in_flight():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(n):
+        with lock:
+            running.append(n)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(n)
+        return n
+
+    result = pymince.iterator.pmap(work, range(20), workers=8, prefetch=3)
+    assert list(result) == list(range(20))
+    assert max(peak) <= 3
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_pmap_exception(backend, ordered):
+    result = pymince.iterator.pmap(fail_on_three, range(10), workers=2, backend=backend, ordered=ordered)
+    with pytest.raises(ZeroDivisionError):
+        list(result)
+
+
+def test_pmap_exception_in_order():
+    result = pymince.iterator.pmap(fail_on_three, range(10), workers=2, chunksize=2)
+    assert next(result) == 0
+    assert next(result) == 1
+    assert next(result) == 2
+    with pytest.raises(ZeroDivisionError):
+        next(result)
+
+
+def test_pmap_invalid_backend():
+    with pytest.raises(ValueError):
+        list(pymince.iterator.pmap(operator.neg, [1], backend="foo"))
@@ -23,3 +23,50 @@ def test_uniquer_given_itemgetter():
     data = ({"id": 1, "name": "n1"}, {"id": 2, "name": "n1"}, {"id": 3, "name": "n2"})
     result = pymince.iterator.uniquer(data, key=getter)
     assert tuple(result) == ({"id": 1, "name": "n1"}, {"id": 3, "name": "n2"})
+
+
+@pytest.mark.parametrize(
+    "capacity,expected",
+    [
+        (1, (1, 2, 1, 3, 2)),
+        (2, (1, 2, 3, 2)),
+        (3, (1, 2, 3)),
+    ],
+)
+def test_uniquer_window(capacity, expected):
+    result = pymince.iterator.uniquer((1, 2, 1, 1, 3, 2), mode="window", capacity=capacity)
+    assert tuple(result) == expected
+
+
+def test_uniquer_window_refreshes_seen_keys():
+    result = pymince.iterator.uniquer((1, 2, 1, 3, 1), mode="window", capacity=2)
+    assert tuple(result) == (1, 2, 3)
+
+
+def test_uniquer_bloom_given_itemgetter():
+    getter = operator.itemgetter("name")
+    data = ({"id": 1, "name": "n1"}, {"id": 2, "name": "n1"}, {"id": 3, "name": "n2"})
+    result = pymince.iterator.uniquer(data, key=getter, mode="bloom", capacity=100)
+    assert tuple(result) == ({"id": 1, "name": "n1"}, {"id": 3, "name": "n2"})
+
+
+def test_uniquer_bloom_error_rate():
+    capacity = 10000
+    data = [n for n in range(capacity) for _ in range(2)]
+    result = list(pymince.iterator.uniquer(data, mode="bloom", capacity=capacity, error_rate=0.01))
+    assert len(result) == len(set(result))  # Duplicates are always dropped.
+    assert len(result) >= capacity * 0.99
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"mode": "foo", "capacity": 10},
+        {"mode": "window"},
+        {"mode": "bloom", "capacity": 0},
+        {"mode": "bloom", "capacity": 10, "error_rate": 1},
+    ],
+)
+def test_uniquer_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        list(pymince.iterator.uniquer((1, 2), **kwargs))
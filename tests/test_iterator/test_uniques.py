@@ -48,3 +48,13 @@ def test_uniques_false_given_itemgetter():
     ]
     uniques = pymince.iterator.uniques(data, key=operator.itemgetter("id", "name"))
     assert not uniques
+
+
+def test_uniques_window():
+    assert pymince.iterator.uniques((1, 2, 1), mode="window", capacity=1)
+    assert not pymince.iterator.uniques((1, 2, 1), mode="window", capacity=2)
+
+
+def test_uniques_bloom():
+    assert pymince.iterator.uniques(range(100), mode="bloom", capacity=100, error_rate=0.0001)
+    assert not pymince.iterator.uniques((1, 2, 1), mode="bloom", capacity=100)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+
+import pytest
+
+import pymince.file
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+def write(filename, content):
+    with pymince.file.xopen(filename, mode="wt") as f:
+        f.write(content)
+
+
+@pytest.mark.parametrize("size", (1, 7, 1024 * 1024))
+@pytest.mark.parametrize("indent", (None, 2))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_concat_dumped_files(extension, indent, size):
+    groups = [[{"key": "ñó]", "n": n} for n in range(10)], [], [[1, "[", {}]], [], ["x"] * 3]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        srcs = [os.path.join(tmpdir, f"src{i}{extension}") for i in range(len(groups))]
+        for src, group in zip(srcs, groups):
+            pymince.json.idump_into(src, group, indent=indent)
+        dst = os.path.join(tmpdir, f"dst{extension}")
+        expected = os.path.join(tmpdir, f"expected{extension}")
+        pymince.json.concat_files(srcs, dst, size=size)
+        pymince.json.idump_into(expected, (obj for group in groups for obj in group), indent=indent)
+        with pymince.file.xopen(dst, mode="rb") as f1, pymince.file.xopen(expected, mode="rb") as f2:
+            assert f1.read() == f2.read()
+
+
+@pytest.mark.parametrize("size", (1, 2, 1024))
+def test_concat_any_layout(size):
+    contents = ("  [ 1 , 2 ]  \n", "[]", "[\n]", "\n\n[3]", '["]"]')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        srcs = [os.path.join(tmpdir, f"src{i}.json") for i in range(len(contents))]
+        for src, content in zip(srcs, contents):
+            write(src, content)
+        dst = os.path.join(tmpdir, "dst.json.gz")
+        pymince.json.concat_files(srcs, dst, size=size)
+        assert pymince.json.load_from(dst) == [1, 2, 3, "]"]
+
+
+def test_concat_nothing():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.concat_files([], dst)
+        assert pymince.json.load_from(dst) == []
+
+
+@pytest.mark.parametrize("content", ("", "  ", '{"a": 1}', "[1, 2"))
+def test_concat_not_array(content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        write(src, content)
+        with pytest.raises(ValueError):
+            pymince.json.concat_files([src], os.path.join(tmpdir, "dst.json"))
+
+
+def test_concat_with_threads():
+    data = [{"n": n} for n in range(1000)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        write(src, json.dumps(data))
+        dst = os.path.join(tmpdir, "dst.json.gz")
+        pymince.json.concat_files([src, src], dst, threads=2)
+        assert pymince.json.load_from(dst) == data + data
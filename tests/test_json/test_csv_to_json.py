@@ -2,6 +2,8 @@
 
 import contextlib
 import csv
+import datetime
+import decimal
 import os
 import tempfile
 
@@ -134,3 +136,161 @@ def test_dumped_data_with_empty_fields():
         pymince.json.csv_to_json(csv_path, json_path, fieldnames=[])
         dumped = pymince.json.load_from(json_path)
         assert dumped == expected
+
+
+def test_dumped_data_with_threads():
+    expected = [
+        {"co l3": "!!!", "col1": "ñoo", "col2": "var", "col4": "123"},
+        {"co l3": "%6$", "col1": "baz", "col2": "foo", "col4": "567"},
+    ]
+    with temp_paths(".json.gz") as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, fieldnames=csv_head, start=1, threads=2)
+        dumped = pymince.json.load_from(json_path)
+        assert dumped == expected
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize("fieldnames", (None, csv_head, ["key1", "key2"]))
+@pytest.mark.parametrize("extension", (".json.gz", ".json"))
+def test_dumped_data_with_workers(extension, fieldnames, workers):
+    with temp_paths(extension) as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, fieldnames=fieldnames)
+        expected = pymince.json.load_from(json_path)
+        pymince.json.csv_to_json(csv_path, json_path, fieldnames=fieldnames, workers=workers)
+        dumped = pymince.json.load_from(json_path)
+        assert dumped == expected
+
+
+@pytest.mark.parametrize("start, stop", ((0, None), (1, 2), (5, 50), (3, 3), (90, None)))
+@pytest.mark.parametrize("strip", (True, False))
+def test_dumped_many_rows_with_workers(start, stop, strip):
+    rows = [[f" ñ{n} ", f'multi\nline "{n}"', f"{n}\r\n", "a,b"] for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, "foo.csv")
+        json_path = os.path.join(tmpdir, "foo.json")
+        with open(csv_path, "w", newline="", encoding=pymince.json.ENCODING) as f:
+            csv.writer(f).writerows([csv_head, *rows])
+
+        kwargs = dict(start=start, stop=stop, strip=strip, indent=2)
+        pymince.json.csv_to_json(csv_path, json_path, **kwargs)
+        with open(json_path, encoding="utf-8") as f:
+            expected = f.read()
+        pymince.json.csv_to_json(csv_path, json_path, workers=3, **kwargs)
+        with open(json_path, encoding="utf-8") as f:
+            assert f.read() == expected
+
+
+@pytest.mark.parametrize("workers", (None, 2))
+def test_dumped_ndjson(workers):
+    with temp_paths(".jsonl") as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, start=1, ndjson=True, workers=workers)
+        dumped = list(pymince.json.iload_lines(json_path))
+        assert dumped == [{"col1": "baz", "col2": "foo", "co l3": "%6$", "col4": "567"}]
+
+
+typed_rows = [
+    ["id", "price", "active", "day", "zip", "note", "ratio"],
+    ["1", "10.50", "true", "2023-01-01", "01234", "foo", "1"],
+    ["2", "", "False", "2023-01-02", "56789", "12", "2.5"],
+]
+
+
+@contextlib.contextmanager
+def typed_paths(extension=".json"):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, "foo.csv")
+        json_path = os.path.join(tmpdir, f"foo{extension}")
+        with open(csv_path, "w", newline="", encoding=pymince.json.ENCODING) as f:
+            csv.writer(f).writerows(typed_rows)
+        yield csv_path, json_path
+
+
+@pytest.mark.parametrize("workers", (None, 2))
+def test_dumped_data_with_schema(workers):
+    schema = {"id": int, "price": decimal.Decimal, "active": bool, "day": datetime.date, "ratio": float}
+    expected = [
+        {"id": 1, "price": "10.50", "active": True, "day": "2023-01-01", "zip": "01234", "note": "foo", "ratio": 1.0},
+        {"id": 2, "price": None, "active": False, "day": "2023-01-02", "zip": "56789", "note": "12", "ratio": 2.5},
+    ]
+    with typed_paths() as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, schema=schema, workers=workers)
+        assert pymince.json.load_from(json_path) == expected
+
+
+def test_dumped_data_with_callable_schema():
+    with typed_paths() as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, schema={"note": str.upper}, stop=1)
+        assert pymince.json.load_from(json_path)[0]["note"] == "FOO"
+
+
+def test_dumped_data_with_invalid_schema():
+    with typed_paths() as (csv_path, json_path):
+        with pytest.raises(ValueError):
+            pymince.json.csv_to_json(csv_path, json_path, schema={"note": int})
+
+
+@pytest.mark.parametrize("workers", (None, 2))
+@pytest.mark.parametrize("ndjson", (False, True))
+def test_dumped_data_with_infer(ndjson, workers):
+    expected = [
+        {"id": 1, "price": 10.5, "active": True, "day": "2023-01-01", "zip": "01234", "note": "foo", "ratio": 1.0},
+        {"id": 2, "price": None, "active": False, "day": "2023-01-02", "zip": "56789", "note": "12", "ratio": 2.5},
+    ]
+    with typed_paths() as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, infer=True, ndjson=ndjson, workers=workers)
+        load = pymince.json.iload_lines if ndjson else pymince.json.iload_from
+        assert list(load(json_path)) == expected
+
+
+def test_dumped_data_with_infer_sample():
+    with typed_paths() as (csv_path, json_path):
+        # The header is excluded from the sample when it is skipped.
+        pymince.json.csv_to_json(csv_path, json_path, fieldnames=typed_rows[0], start=1, stop=2, infer=1)
+        dumped = pymince.json.load_from(json_path)
+        assert dumped == [
+            {"id": 1, "price": 10.5, "active": True, "day": "2023-01-01", "zip": "01234", "note": "foo", "ratio": 1},
+        ]
+
+
+def test_dumped_data_with_infer_small_sample():
+    with typed_paths() as (csv_path, json_path):
+        with pytest.raises(ValueError):
+            # "ratio" is inferred as int from the first row.
+            pymince.json.csv_to_json(csv_path, json_path, infer=1)
+
+
+def test_dumped_data_with_infer_and_schema():
+    with typed_paths() as (csv_path, json_path):
+        pymince.json.csv_to_json(csv_path, json_path, infer=True, schema={"id": str})
+        dumped = pymince.json.load_from(json_path)
+        assert dumped[0]["id"] == "1"
+        assert dumped[0]["active"] is True
+
+
+@pytest.mark.parametrize("start", (0, 1, 2, 3))
+def test_dumped_data_with_workers_and_blank_lines(start):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, "foo.csv")
+        json_path = os.path.join(tmpdir, "foo.json")
+        with open(csv_path, "w", newline="", encoding=pymince.json.ENCODING) as f:
+            f.write('a,b\r\n\r\n1,"x\r\n\r\ny"\n\n2,z\n3,w')
+
+        pymince.json.csv_to_json(csv_path, json_path, start=start)
+        expected = pymince.json.load_from(json_path)
+        pymince.json.csv_to_json(csv_path, json_path, start=start, workers=2)
+        assert pymince.json.load_from(json_path) == expected
+
+
+@pytest.mark.parametrize("start", (0, 1, 3, 4, 10))
+def test_dumped_blank_lines_with_workers(start):
+    content = 'a,b\r\n\r\n1,"x\n\ny"\n\n2,z\r\n\n3,"q""\n"\n4,w'
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, "foo.csv")
+        json_path = os.path.join(tmpdir, "foo.json")
+        with open(csv_path, "w", newline="", encoding=pymince.json.ENCODING) as f:
+            f.write(content)
+
+        pymince.json.csv_to_json(csv_path, json_path, start=start)
+        expected = pymince.json.load_from(json_path)
+        pymince.json.csv_to_json(csv_path, json_path, start=start, workers=2)
+        assert pymince.json.load_from(json_path) == expected
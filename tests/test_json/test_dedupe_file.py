@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import operator
+import os
+import random
+import tempfile
+
+import pytest
+
+import pymince.iterator
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+@pytest.fixture
+def data():
+    rand = random.Random(0)
+    return [{"id": rand.randint(0, 200), "seq": n, "text": "ñó"} for n in range(1000)]
+
+
+@pytest.mark.parametrize("memory_limit", (1, 1000, 1024 * 1024))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_dedupe_json_array(data, extension, memory_limit):
+    key = operator.itemgetter("id")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, f"src{extension}")
+        dst = os.path.join(tmpdir, f"dst{extension}")
+        pymince.json.idump_into(src, data)
+        pymince.json.dedupe_file(src, dst, key=key, memory_limit=memory_limit)
+        assert pymince.json.load_from(dst) == list(pymince.iterator.uniquer(data, key=key))
+
+
+@pytest.mark.parametrize("partitions", (1, 3, 64))
+def test_dedupe_ndjson(data, partitions):
+    key = operator.itemgetter("id")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.jsonl")
+        dst = os.path.join(tmpdir, "dst.jsonl.gz")
+        pymince.json.dump_ndjson_into(src, data)
+        pymince.json.dedupe_file(src, dst, key=key, ndjson=True, memory_limit=1000, partitions=partitions)
+        assert list(pymince.json.iload_lines(dst)) == list(pymince.iterator.uniquer(data, key=key))
+
+
+@pytest.mark.parametrize("memory_limit", (1, 1024 * 1024))
+def test_dedupe_whole_elements(memory_limit):
+    data = [{"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 2}, [1], {"a": 1, "b": 2}, [1], "x"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.idump_into(src, data)
+        pymince.json.dedupe_file(src, dst, memory_limit=memory_limit)
+        result = pymince.json.load_from(dst)
+    assert result == [{"a": 1, "b": 2}, {"a": 2}, [1], "x"]
+    assert list(result[0]) == ["a", "b"]
+
+
+def test_dedupe_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.idump_into(src, [])
+        pymince.json.dedupe_file(src, dst)
+        assert pymince.json.load_from(dst) == []
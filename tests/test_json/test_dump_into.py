@@ -25,3 +25,13 @@ def test_dumped_data(extension):
         pymince.json.dump_into(filename, data)
         dumped = pymince.json.load_from(filename)
     assert dumped == data
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_dumped_data_with_threads(extension):
+    data = {"key": "ñó", "nested": list(range(1000))}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.dump_into(filename, data, threads=2)
+        dumped = pymince.json.load_from(filename)
+    assert dumped == data
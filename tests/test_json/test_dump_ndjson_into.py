@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pytest
+
+import pymince.file
+import pymince.json
+
+EXTENSIONS = (".jsonl.gz", ".jsonl.bz2", ".jsonl.xz", ".jsonl")
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_dumped_data(extension):
+    data = [{"key": "ñó", "nested": [1, 2, 3]}, {"b": None}, [1], "foo"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.dump_ndjson_into(filename, iter(data))
+        with pymince.file.xopen(filename, mode="rt") as f:
+            content = f.read()
+    assert content == '{"key": "ñó", "nested": [1, 2, 3]}\n{"b": null}\n[1]\n"foo"\n'
+
+
+@pytest.mark.parametrize("batch", (1, 2, 1024))
+def test_dumped_batches(batch):
+    data = [{"value": n} for n in range(10)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.jsonl")
+        pymince.json.dump_ndjson_into(filename, data, batch=batch)
+        result = list(pymince.json.iload_lines(filename))
+    assert result == data
+
+
+def test_dumped_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.jsonl")
+        pymince.json.dump_ndjson_into(filename, [])
+        assert os.path.getsize(filename) == 0
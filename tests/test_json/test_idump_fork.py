@@ -2,6 +2,9 @@
 
 import os
 import tempfile
+import threading
+import time
+import unittest.mock
 
 import pytest
 
@@ -59,3 +62,148 @@ def test_dumped_empty_data(dump_if_empty):
             assert read(path) == '[\n]'
         else:
             assert not os.path.exists(path)
+
+
+def test_dumped_with_threads():
+    with tempfile.TemporaryDirectory() as tmp:
+        foo_path = os.path.join(tmp, "foo.json.gz")
+        var_path = os.path.join(tmp, "var.json.gz")
+        path_items = (
+            (foo_path, ({"a": 1}, {"b": 2})),
+            (var_path, ({"c": 3},)),
+            (foo_path, ({"d": 4},)),
+        )
+        pymince.json.idump_fork(iter(path_items), threads=2)
+
+        assert pymince.json.load_from(foo_path) == [{"a": 1}, {"b": 2}, {"d": 4}]
+        assert pymince.json.load_from(var_path) == [{"c": 3}]
+
+
+@pytest.mark.parametrize("extension", (".json.gz", ".json.bz2", ".json.xz", ".json"))
+@pytest.mark.parametrize("max_open", (1, 2, 3, 100))
+def test_dumped_with_max_open(max_open, extension):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{n}{extension}") for n in range(5)]
+        path_items = [(paths[n % 5], [{"n": n}, {"m": n}]) for n in range(23)]
+        path_items.append((paths[0], ()))
+        pymince.json.idump_fork(iter(path_items), max_open=max_open, indent=2)
+
+        for i, path in enumerate(paths):
+            expected = [obj for n in range(i, 23, 5) for obj in ({"n": n}, {"m": n})]
+            assert pymince.json.load_from(path) == expected
+
+
+def test_dumped_with_max_open_keeps_open_files():
+    opened = set()
+    max_opened = 0
+    xopen = pymince.file.xopen
+
+    def tracked_xopen(name, *args, **kwargs):
+        nonlocal max_opened
+        fd = xopen(name, *args, **kwargs)
+        close = fd.close
+        opened.add(name)
+        max_opened = max(max_opened, len(opened))
+        fd.close = lambda: opened.discard(name) or close()
+        return fd
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{n}.json") for n in range(10)]
+        path_items = [(paths[n % 10], ({"n": n},)) for n in range(50)]
+        with unittest.mock.patch("pymince.file.xopen", tracked_xopen):
+            pymince.json.idump_fork(iter(path_items), max_open=3, dump_if_empty=False)
+
+        assert max_opened <= 3
+        assert not opened
+        assert read(paths[0]) == '[\n{"n": 0},\n{"n": 10},\n{"n": 20},\n{"n": 30},\n{"n": 40}\n]'
+
+
+@pytest.mark.parametrize("dump_if_empty", (True, False))
+def test_dumped_empty_data_with_max_open(dump_if_empty):
+    with tempfile.TemporaryDirectory() as tmp:
+        foo_path = os.path.join(tmp, "foo.json")
+        var_path = os.path.join(tmp, "var.json")
+        path_items = ((foo_path, ()), (var_path, ({"a": 1},)), (foo_path, ()))
+        pymince.json.idump_fork(iter(path_items), dump_if_empty=dump_if_empty, max_open=1)
+        assert read(var_path) == '[\n{"a": 1}\n]'
+        if dump_if_empty:
+            assert read(foo_path) == '[\n]'
+        else:
+            assert not os.path.exists(foo_path)
+
+
+def test_invalid_max_open():
+    with pytest.raises(ValueError):
+        pymince.json.idump_fork(iter(()), max_open=0)
+
+
+@pytest.mark.parametrize("max_open", (None, 2))
+@pytest.mark.parametrize("background", (True, 1, 3))
+def test_dumped_in_background(background, max_open):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{n}.json.gz") for n in range(5)]
+        path_items = [(paths[n % 5], [{"n": n}, {"m": n}]) for n in range(23)]
+        pymince.json.idump_fork(iter(path_items), background=background, max_open=max_open)
+
+        for i, path in enumerate(paths):
+            expected = [obj for n in range(i, 23, 5) for obj in ({"n": n}, {"m": n})]
+            assert pymince.json.load_from(path) == expected
+
+
+@pytest.mark.parametrize("background", (2, 3, 8))
+def test_dumped_in_background_keeps_max_open(background):
+    lock = threading.Lock()
+    opened = set()
+    max_opened = 0
+    xopen = pymince.file.xopen
+
+    def tracked_xopen(name, *args, **kwargs):
+        nonlocal max_opened
+        fd = xopen(name, *args, **kwargs)
+        close = fd.close
+        with lock:
+            opened.add(name)
+            max_opened = max(max_opened, len(opened))
+        time.sleep(0.001)  # Give other threads the chance to open files meanwhile.
+
+        def tracked_close():
+            with lock:
+                opened.discard(name)
+            close()
+
+        fd.close = tracked_close
+        return fd
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{n}.json") for n in range(10)]
+        path_items = [(paths[n % 10], ({"n": n},)) for n in range(100)]
+        with unittest.mock.patch("pymince.file.xopen", tracked_xopen):
+            pymince.json.idump_fork(iter(path_items), max_open=2, background=background)
+
+        assert max_opened <= 2
+        assert not opened
+        assert pymince.json.load_from(paths[3]) == [{"n": n} for n in range(3, 100, 10)]
+
+
+def test_dumped_in_background_with_writer_error():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "not-found", "foo.json")
+        path_items = [(path, [{"n": n} for n in range(5000)])]
+        with pytest.raises(FileNotFoundError):
+            pymince.json.idump_fork(iter(path_items), background=True)
+
+
+def test_dumped_in_background_with_producer_error():
+    def items():
+        yield {"a": 1}
+        raise ZeroDivisionError
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "foo.json")
+        with pytest.raises(ZeroDivisionError):
+            pymince.json.idump_fork(iter([(path, items())]), background=True)
+
+
+def test_invalid_background():
+    with pytest.raises(ValueError):
+        pymince.json.idump_fork(iter(()), background=-1)
@@ -3,6 +3,9 @@
 import os
 import tempfile
 
+import pytest
+
+import pymince.file
 import pymince.json
 
 
@@ -59,3 +62,39 @@ def test_dumped_empty():
         pymince.json.idump_into(filename, [])
         dumped = pymince.json.load_from(filename)
     assert dumped == []
+
+
+@pytest.mark.parametrize("extension", (".json.gz", ".json.bz2", ".json.xz", ".json"))
+def test_dumped_with_threads(extension):
+    data = [{"key": "ñó", "value": n} for n in range(1000)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(filename, iter(data), threads=4)
+        dumped = pymince.json.load_from(filename)
+    assert dumped == data
+
+
+@pytest.mark.parametrize("size", (1, 10, 1024 * 1024))
+@pytest.mark.parametrize("extension", (".json.gz", ".json"))
+def test_dumped_with_size(extension, size):
+    data = [{"key": "ñó", "value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(filename, iter(data), size=size, indent=2)
+        with pymince.file.xopen(filename, mode="rb") as f:
+            dumped = f.read()
+    assert dumped == "".join(pymince.json.idump_lines(data, indent=2)).encode("utf-8")
+
+
+@pytest.mark.parametrize("encoding", ("utf-8-sig", "utf-16", "utf-32", "latin-1"))
+@pytest.mark.parametrize("extension", (".json", ".json.gz"))
+def test_idump_with_encoding(encoding, extension):
+    data = [{"key": "ñó", "n": n} for n in range(50)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        expected = os.path.join(tmpdir, "expected.json")
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(expected, data)
+        pymince.json.idump_into(filename, data, encoding=encoding, size=10)
+        with open(expected, mode="rb") as f, pymince.file.xopen(filename, mode="rb") as g:
+            assert g.read() == f.read().decode().encode(encoding)  # A single BOM, if any.
+        assert pymince.json.load_from(filename, encoding=encoding) == data
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 import pymince.json
 
 
@@ -50,3 +52,19 @@ def test_dumped_str():
     result = pymince.json.idump_lines(data)
     result = json.loads("".join(result))
     assert result == list(data)
+
+
+@pytest.mark.parametrize("indent", (0, 2, 4, "\t"))
+def test_dumped_indent(indent):
+    data = [{"a": [1, {"b": "x\ny"}], "c": {}}, [], "d"]
+    result = "".join(pymince.json.idump_lines(data, indent=indent))
+    expected = json.dumps(data, indent=indent, ensure_ascii=False)
+    assert result == expected
+
+
+def test_dumped_large_element_in_chunks():
+    data = [{"key": list(range(100_000))}]
+    result = list(pymince.json.idump_lines(data, indent=2))
+    assert len(result) > 5
+    assert max(map(len, result)) < 1024 * 1024
+    assert json.loads("".join(result)) == data
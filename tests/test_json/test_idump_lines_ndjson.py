@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+import pymince.json
+
+
+def test_dumped_lines():
+    data = [{"key": "ñó", "nested": [1, 2, 3]}, {"b": None}]
+    result = list(pymince.json.idump_lines_ndjson(iter(data)))
+    assert result == ['{"key": "ñó", "nested": [1, 2, 3]}\n', '{"b": null}\n']
+    assert [json.loads(line) for line in result] == data
+
+
+def test_dumped_empty():
+    assert list(pymince.json.idump_lines_ndjson([])) == []
+
+
+def test_dumped_with_kwargs():
+    result = pymince.json.idump_lines_ndjson([{"b": 1, "a": 2}], sort_keys=True, separators=(",", ":"))
+    assert list(result) == ['{"a":2,"b":1}\n']
+
+
+def test_indent_not_allowed():
+    with pytest.raises(ValueError):
+        list(pymince.json.idump_lines_ndjson([{"a": 1}], indent=2))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pytest
+
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+def load_shards(tmpdir, manifest):
+    result = []
+    for shard in manifest:
+        filename = os.path.join(tmpdir, shard["name"])
+        data = pymince.json.load_from(filename)
+        assert len(data) == shard["count"]
+        assert os.path.getsize(filename) == shard["size"]
+        result.extend(data)
+    return result
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_max_items(extension):
+    data = [{"key": "ñó", "value": n} for n in range(25)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{:05d}" + extension)
+        manifest = pymince.json.idump_sharded(pattern, iter(data), max_items=10)
+        assert [shard["name"] for shard in manifest] == [f"out-0000{n}{extension}" for n in range(3)]
+        assert [shard["count"] for shard in manifest] == [10, 10, 5]
+        assert load_shards(tmpdir, manifest) == data
+        assert pymince.json.load_from(os.path.join(tmpdir, "manifest.json")) == manifest
+
+
+@pytest.mark.parametrize("size", (1, 100, 1024 * 1024))
+@pytest.mark.parametrize("max_bytes", (200, 1000, 5000))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_max_bytes(extension, max_bytes, size):
+    data = [{"key": "ñó" * (n % 7), "value": n} for n in range(300)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{}" + extension)
+        manifest = pymince.json.idump_sharded(pattern, data, max_bytes=max_bytes, size=size)
+        assert all(shard["size"] <= max_bytes for shard in manifest)
+        assert load_shards(tmpdir, manifest) == data
+
+
+def test_max_items_and_max_bytes():
+    data = [{"value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{}.json")
+        manifest = pymince.json.idump_sharded(pattern, data, max_items=30, max_bytes=200, indent=2)
+        assert all(shard["size"] <= 200 and shard["count"] <= 30 for shard in manifest)
+        assert load_shards(tmpdir, manifest) == data
+
+
+def test_element_larger_than_max_bytes():
+    data = [{"value": 1}, {"value": "x" * 100}, {"value": 2}]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{}.json")
+        manifest = pymince.json.idump_sharded(pattern, data, max_bytes=50)
+        assert [shard["count"] for shard in manifest] == [1, 1, 1]
+        assert load_shards(tmpdir, manifest) == data
+
+
+def test_manifest_path_and_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{}.json")
+        manifest_path = os.path.join(tmpdir, "shards.json")
+        manifest = pymince.json.idump_sharded(pattern, [], max_items=10, manifest=manifest_path)
+        assert manifest == []
+        assert os.listdir(tmpdir) == ["shards.json"]
+        assert pymince.json.load_from(manifest_path) == []
+
+
+def test_invalid_max_items():
+    with pytest.raises(ValueError):
+        pymince.json.idump_sharded("out-{}.json", [], max_items=0)
+
+
+@pytest.mark.parametrize("encoding", ("utf-8-sig", "utf-16"))
+@pytest.mark.parametrize("extension", (".json", ".json.gz"))
+def test_encoding(extension, encoding):
+    data = [{"key": "ñó" * (n % 7), "value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern = os.path.join(tmpdir, "out-{}" + extension)
+        manifest = pymince.json.idump_sharded(pattern, data, max_bytes=1500, encoding=encoding, size=100)
+        assert len(manifest) > 1
+        assert all(shard["size"] <= 1500 for shard in manifest)
+        result = []
+        for shard in manifest:
+            result.extend(pymince.json.load_from(os.path.join(tmpdir, shard["name"]), encoding=encoding))
+        assert result == data
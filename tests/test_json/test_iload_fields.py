@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pytest
+
+import pymince.json
+
+EXTENSIONS = (".gz", ".bz2", ".xz", "")
+
+data = [
+    {"id": 1, "ts": "2023", "user": {"name": "ñó", "age": 2}, "extra": [1, 2, {"id": 9}]},
+    {"id": 2, "user": "anonymous"},
+    {"ts": "2024", "user": {"age": 3}},
+    [1, 2],
+]
+
+
+@pytest.mark.parametrize("ndjson", (False, True))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_load_fields(extension, ndjson):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo.json{extension}")
+        dump = pymince.json.dump_ndjson_into if ndjson else pymince.json.idump_into
+        dump(filename, data)
+        result = list(pymince.json.iload_fields(filename, ("id", "ts", "user.name"), ndjson=ndjson))
+
+    assert result == [
+        {"id": 1, "ts": "2023", "user": {"name": "ñó"}},
+        {"id": 2},
+        {"ts": "2024", "user": {}},
+        [1, 2],
+    ]
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    (
+        ((), {}),
+        (("user",), {"user": {"name": "ñó", "age": 2}}),
+        (("user", "user.name"), {"user": {"name": "ñó", "age": 2}}),
+        (("user.name", "user"), {"user": {"name": "ñó", "age": 2}}),
+        ((("user", "age"), "missing.key"), {"user": {"age": 2}}),
+        ((("a.b",),), {"a.b": 1}),
+    ),
+)
+def test_load_nested_fields(fields, expected):
+    obj = {"id": 1, "user": {"name": "ñó", "age": 2}, "a": {"b": 0}, "a.b": 1}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, [obj])
+        assert list(pymince.json.iload_fields(filename, fields)) == [expected]
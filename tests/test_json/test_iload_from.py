@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import os
+import tempfile
+
+import pytest
+
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_load_dumped_data(extension):
+    data = [{"key": "ñó", "nested": [1, 2, 3]}, 1, 2.5, "foo", None, True, [], {}]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(filename, data)
+        result = list(pymince.json.iload_from(filename))
+    assert result == data
+
+
+@pytest.mark.parametrize("indent", (None, 2))
+@pytest.mark.parametrize("size", (1, 2, 3, 7, 64))
+def test_load_with_small_blocks(size, indent):
+    data = [{"key": "ñó" * 10, "nested": [1, 2, 3]}, 12345, -1.5e10, "a,]b", False]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, data, indent=indent)
+        result = list(pymince.json.iload_from(filename, size=size))
+    assert result == data
+
+
+@pytest.mark.parametrize("content", ("[]", " [ ] ", "[\n]"))
+def test_load_empty(content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
+        result = list(pymince.json.iload_from(filename))
+    assert result == []
+
+
+@pytest.mark.parametrize("content", ("", "{}", "[1,", "[1 2]", "[1,]", "[,1]", "[1", "[tru]"))
+def test_load_invalid(content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
+        with pytest.raises(json.JSONDecodeError):
+            list(pymince.json.iload_from(filename, size=1))
+
+
+@pytest.mark.parametrize("size", (1, 3, 64))
+@pytest.mark.parametrize("content, pos", (("[1,2] garbage", 6), ("[1,2]]", 5), ("[1,2]\n[3]", 6), ("[] {}", 3)))
+def test_load_trailing_data(content, pos, size):
+    with pytest.raises(json.JSONDecodeError, match="Extra data") as exc:
+        list(pymince.json._iload_array(io.StringIO(content).read, size))
+    assert exc.value.pos == pos
+
+
+@pytest.mark.parametrize("size", (1, 64))
+def test_load_trailing_whitespace(size):
+    assert list(pymince.json._iload_array(io.StringIO("[1, 2] \n\t ").read, size)) == [1, 2]
+
+
+def test_load_is_lazy():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write('[1, 2, "invalid')
+        it = pymince.json.iload_from(filename, size=1)
+        assert next(it) == 1
+        assert next(it) == 2
+        with pytest.raises(json.JSONDecodeError):
+            next(it)
+
+
+def test_load_with_not_found():
+    with pytest.raises(FileNotFoundError):
+        list(pymince.json.iload_from("foo.json"))
+
+
+@pytest.mark.parametrize("size", (1, 2, 3, 5, 8, 13))
+def test_load_floats_split_across_blocks(size):
+    data = [1.5e10, -0.0, 2.25, 1e-07, 123.456e-5, 7, 0.1]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, data)
+        result = list(pymince.json.iload_from(filename, size=size))
+    assert result == data
+
+
+def test_load_invalid_position():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("[1,\n 22, x, " + ", ".join(["333"] * 1000) + "]")
+        with pytest.raises(json.JSONDecodeError) as exc:
+            list(pymince.json.iload_from(filename, size=4))
+    assert (exc.value.pos, exc.value.lineno, exc.value.colno) == (9, 2, 6)
+
+
+def test_load_invalid_stops_reading():
+    stream = io.StringIO("[1, x, " + ", ".join(["333"] * 100000) + "]")
+    with pytest.raises(json.JSONDecodeError):
+        list(pymince.json._iload_array(stream.read, 16))
+    assert stream.tell() < 100
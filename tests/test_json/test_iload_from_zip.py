@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pytest
+
+import pymince.json
+
+
+@pytest.fixture(name="archive")
+def archive_fixture():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zip_path = os.path.join(tmpdir, "archive.zip")
+        with pymince.json.ZipJSONWriter(zip_path) as writer:
+            for n in range(20):
+                writer.dump(f"data/{n:02d}.json", {"value": n, "key": "ñó"})
+            writer.dump("other.txt", "foo")
+        yield zip_path
+
+
+@pytest.mark.parametrize("workers", (None, 1, 3))
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_load_by_pattern(archive, backend, workers):
+    result = list(pymince.json.iload_from_zip(archive, r"^data/", workers=workers, backend=backend))
+    expected = [(f"data/{n:02d}.json", {"value": n, "key": "ñó"}) for n in range(20)]
+    assert result == expected
+
+
+@pytest.mark.parametrize("workers", (None, 3))
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_load_by_names(archive, backend, workers):
+    names = ["other.txt", "data/05.json"]
+    result = list(pymince.json.iload_from_zip(archive, iter(names), workers=workers, backend=backend))
+    assert result == [("other.txt", "foo"), ("data/05.json", {"value": 5, "key": "ñó"})]
+
+
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_load_unordered(archive, backend):
+    result = pymince.json.iload_from_zip(archive, r"^data/", workers=3, backend=backend, ordered=False)
+    expected = [(f"data/{n:02d}.json", {"value": n, "key": "ñó"}) for n in range(20)]
+    assert sorted(result, key=lambda pair: pair[0]) == expected
+
+
+@pytest.mark.parametrize("workers", (None, 2))
+def test_load_not_found_member(archive, workers):
+    with pytest.raises(KeyError):
+        list(pymince.json.iload_from_zip(archive, ["foo.json"], workers=workers))
+
+
+def test_invalid_backend(archive):
+    with pytest.raises(ValueError):
+        list(pymince.json.iload_from_zip(archive, r".*", backend="foo"))
+
+
+def test_load_with_not_found():
+    with pytest.raises(FileNotFoundError):
+        list(pymince.json.iload_from_zip("archive.zip", r".*"))
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+
+import pytest
+
+import pymince.file
+import pymince.json
+
+EXTENSIONS = (".jsonl.gz", ".jsonl.bz2", ".jsonl.xz", ".jsonl")
+
+
+def write(filename, content):
+    with pymince.file.xopen(filename, mode="wt") as f:
+        f.write(content)
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_load_given_filepath(extension):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        write(filename, '{"key": "ñó"}\n[1, 2]\n3\n')
+        result = list(pymince.json.iload_lines(filename))
+    assert result == [{"key": "ñó"}, [1, 2], 3]
+
+
+@pytest.mark.parametrize("size", (1, 2, 5, 1024))
+@pytest.mark.parametrize("content", ('{"a": 1}\n{"b": 2}', '{"a": 1}\r\n{"b": 2}\r\n', '\n{"a": 1}\n \n{"b": 2}\n\n'))
+def test_load_lines(content, size):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.jsonl")
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        result = list(pymince.json.iload_lines(filename, size=size))
+    assert result == [{"a": 1}, {"b": 2}]
+
+
+def test_load_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.jsonl")
+        write(filename, "")
+        assert list(pymince.json.iload_lines(filename)) == []
+
+
+def test_load_invalid():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.jsonl")
+        write(filename, '{"a": 1}\n{"b": \n')
+        with pytest.raises(json.JSONDecodeError):
+            list(pymince.json.iload_lines(filename))
+
+
+def test_load_with_not_found():
+    with pytest.raises(FileNotFoundError):
+        list(pymince.json.iload_lines("foo.jsonl"))
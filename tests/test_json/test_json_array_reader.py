@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import pathlib
+import struct
+import tempfile
+
+import pytest
+
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+@pytest.mark.parametrize("indent", (None, 2))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_random_access(extension, indent):
+    data = [{"key": "ñó", "value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(filename, iter(data), index=True, indent=indent)
+
+        assert pymince.json.load_from(filename) == data
+        with pymince.json.JSONArrayReader(filename) as reader:
+            assert len(reader) == 100
+            assert reader[0] == data[0]
+            assert reader[57] == data[57]
+            assert reader[3] == data[3]
+            assert reader[-1] == data[-1]
+            assert reader[10:20] == data[10:20]
+            assert reader[::-7] == data[::-7]
+            assert list(reader) == data
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_random_access_many_members(extension):
+    data = [{"value": n, "text": os.urandom(8).hex()} for n in range(2000)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json._idump_indexed(filename, data, pymince.json.ENCODING, {}, size=1000)
+
+        assert list(pymince.json.iload_from(filename)) == data
+        with pymince.json.JSONArrayReader(filename) as reader:
+            assert reader[1999] == data[1999]
+            assert reader[1000] == data[1000]
+            assert reader[1001] == data[1001]
+            assert reader[5] == data[5]
+            assert reader[500:1500] == data[500:1500]
+
+
+def test_random_access_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json.gz")
+        pymince.json.idump_into(filename, [], index=True)
+
+        assert pymince.json.load_from(filename) == []
+        with pymince.json.JSONArrayReader(filename) as reader:
+            assert len(reader) == 0
+            assert reader[:] == []
+            with pytest.raises(IndexError):
+                reader[0]
+
+
+def test_index_out_of_range():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, [1, 2], index=True)
+        with pymince.json.JSONArrayReader(filename) as reader:
+            assert reader[-2] == 1
+            with pytest.raises(IndexError):
+                reader[2]
+            with pytest.raises(IndexError):
+                reader[-3]
+            with pytest.raises(TypeError):
+                reader["0"]
+
+
+def test_index_not_found():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, [1, 2])
+        with pytest.raises(FileNotFoundError):
+            pymince.json.JSONArrayReader(filename)
+
+
+def test_index_with_threads():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json.gz")
+        with pytest.raises(ValueError):
+            pymince.json.idump_into(filename, [1, 2], index=True, threads=2)
+
+
+@pytest.mark.parametrize("encoding", ("utf-8-sig", "utf-16"))
+@pytest.mark.parametrize("extension", (".json.gz", ".json"))
+def test_random_access_with_encoding(extension, encoding):
+    data = [{"key": "ñó", "value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json._idump_indexed(filename, data, encoding, {}, size=100)
+
+        assert pymince.json.load_from(filename, encoding=encoding) == data
+        with pymince.json.JSONArrayReader(filename, encoding=encoding) as reader:
+            assert reader[0] == data[0]
+            assert list(reader) == data
+
+
+def test_random_access_with_path():
+    data = [{"value": n} for n in range(10)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = pathlib.Path(tmpdir) / "foo.json.gz"
+        pymince.json.idump_into(filename, data, index=True)
+
+        with pymince.json.JSONArrayReader(filename) as reader:
+            assert reader[7] == data[7]
+            assert list(reader) == data
+
+
+def test_index_is_little_endian():
+    data = [{"value": n} for n in range(3)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(filename, data, index=True)
+        with open(filename + pymince.json.INDEX_EXTENSION, mode="rb") as f:
+            offsets = list(struct.iter_unpack("<QQQ", f.read()))
+        with open(filename, mode="rb") as f:
+            content = f.read()
+    assert [json.loads(content[start:stop]) for _, start, stop in offsets] == data
+
+
+def test_close_releases_the_stream():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "foo.json.gz")
+        pymince.json.idump_into(filename, [1, 2, 3], index=True)
+        reader = pymince.json.JSONArrayReader(filename)
+        assert reader[1] == 2
+        stream = reader._stream
+        reader.close()
+        assert stream.closed
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import array
 import dataclasses
 import datetime
 import decimal
 import enum
+import operator
+import pathlib
 import uuid
 
 import pytest
@@ -58,9 +61,72 @@ def test_encode_dataclass():
     assert res == expected
 
 
-def test_unsupported():
+def test_encode_nested_dataclass():
+    @dataclasses.dataclass
+    class Foo:
+        a: int
+
+    @dataclasses.dataclass
+    class Bar:
+        foo: Foo
+        foos: list
+
+    expected = '{"foo": {"a": 1}, "foos": [{"a": 2}]}'
+    res = pymince.json.JSONEncoder().encode(Bar(foo=Foo(a=1), foos=[Foo(a=2)]))
+    assert res == expected
+
+
+def test_encode_enum():
     class MyEnum(enum.Enum):
         foo = "foo"
+        bar = 1
+
+    expected = '{"foo": "foo", "bar": 1}'
+    res = pymince.json.JSONEncoder().encode({"foo": MyEnum.foo, "bar": MyEnum.bar})
+    assert res == expected
+
+
+def test_encode_path():
+    expected = '{"path": "foo/bar.json"}'
+    res = pymince.json.JSONEncoder().encode({"path": pathlib.PurePosixPath("foo", "bar.json")})
+    assert res == expected
+
 
+def test_encode_bytes():
+    expected = '{"bytes": "Zm9v", "bytearray": "YmFy"}'
+    res = pymince.json.JSONEncoder().encode({"bytes": b"foo", "bytearray": bytearray(b"bar")})
+    assert res == expected
+
+
+def test_encode_arrays():
+    expected = '{"array": [1, 2, 3], "memoryview": [102, 111, 111]}'
+    res = pymince.json.JSONEncoder().encode({"array": array.array("i", (1, 2, 3)), "memoryview": memoryview(b"foo")})
+    assert res == expected
+
+
+def test_register():
+    class Encoder(pymince.json.JSONEncoder):
+        pass
+
+    class Point(complex):
+        pass
+
+    Encoder.register(complex, lambda c: [c.real, c.imag])
+    assert Encoder().encode([1 + 2j, Point(3, 4)]) == "[[1.0, 2.0], [3.0, 4.0]]"
+    with pytest.raises(TypeError):
+        pymince.json.JSONEncoder().encode(1 + 2j)  # Registry of the subclass
+
+
+def test_register_overrides_cached():
+    class Encoder(pymince.json.JSONEncoder):
+        pass
+
+    assert Encoder().encode(datetime.date(2023, 1, 1)) == '"2023-01-01"'
+    Encoder.register(datetime.date, operator.attrgetter("year"))
+    assert Encoder().encode(datetime.date(2023, 1, 1)) == "2023"
+    assert Encoder().encode(datetime.datetime(2023, 1, 1)) == "2023"
+
+
+def test_unsupported():
     with pytest.raises(TypeError):
-        pymince.json.JSONEncoder().encode({"enum": MyEnum.foo})
+        pymince.json.JSONEncoder().encode({"object": object()})
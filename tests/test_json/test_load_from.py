@@ -27,3 +27,29 @@ def test_load_given_filepath(extension):
 def test_load_from_with_not_found():
     with pytest.raises(FileNotFoundError):
         pymince.json.load_from("foo.json")
+
+
+@pytest.mark.parametrize("backend", ("stdlib", "orjson"))
+@pytest.mark.parametrize("encoding", ("utf-8", "latin-1", "utf-16"))
+def test_load_uncompressed_with_backend(backend, encoding):
+    if backend != "stdlib":
+        pytest.importorskip(backend)
+    data = {"key": "ñó", "inf": float("inf")}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "foo.json")
+        with open(path, mode="w", encoding=encoding) as fd:
+            fd.write(json.dumps(data, ensure_ascii=False))
+        try:
+            pymince.json.use_backend(backend)
+            result = pymince.json.load_from(path, encoding=encoding)
+        finally:
+            pymince.json.use_backend("stdlib")
+    assert result == data
+
+
+def test_load_empty_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "foo.json")
+        open(path, mode="w").close()
+        with pytest.raises(json.JSONDecodeError):
+            pymince.json.load_from(path)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import operator
+import os
+import random
+import tempfile
+
+import pytest
+
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+
+@pytest.fixture
+def data():
+    rand = random.Random(0)
+    return [{"id": rand.randint(0, 50), "seq": n, "text": "ñó"} for n in range(500)]
+
+
+@pytest.mark.parametrize("memory_limit", (1, 1000, 1024 * 1024))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_sort_json_array(data, extension, memory_limit):
+    key = operator.itemgetter("id")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, f"src{extension}")
+        dst = os.path.join(tmpdir, f"dst{extension}")
+        pymince.json.idump_into(src, data)
+        pymince.json.sort_file(src, dst, key=key, memory_limit=memory_limit)
+        assert pymince.json.load_from(dst) == sorted(data, key=key)
+
+
+@pytest.mark.parametrize("memory_limit", (1, 1000))
+def test_sort_ndjson_reverse(data, memory_limit):
+    key = operator.itemgetter("id")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.jsonl")
+        dst = os.path.join(tmpdir, "dst.jsonl.gz")
+        pymince.json.dump_ndjson_into(src, data)
+        pymince.json.sort_file(src, dst, key=key, reverse=True, ndjson=True, memory_limit=memory_limit)
+        assert list(pymince.json.iload_lines(dst)) == sorted(data, key=key, reverse=True)
+
+
+def test_sort_many_runs_without_key():
+    data = [random.Random(1).random() for _ in range(300)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.idump_into(src, data)
+        # A run per element, merged in several passes.
+        pymince.json.sort_file(src, dst, memory_limit=1)
+        assert pymince.json.load_from(dst) == sorted(data)
+
+
+def test_sort_with_workers(data):
+    key = operator.itemgetter("id")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.idump_into(src, data)
+        pymince.json.sort_file(src, dst, key=key, memory_limit=1000, workers=2, indent=2)
+        assert pymince.json.load_from(dst) == sorted(data, key=key)
+
+
+def test_sort_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src.json")
+        dst = os.path.join(tmpdir, "dst.json")
+        pymince.json.idump_into(src, [])
+        pymince.json.sort_file(src, dst)
+        assert pymince.json.load_from(dst) == []
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+
+import pytest
+
+import pymince.file
+import pymince.json
+
+EXTENSIONS = (".json.gz", ".json.bz2", ".json.xz", ".json")
+
+DATA = [
+    {"key": "ñó", "n": 1},
+    {"brackets": "]}[{", "quote": '"]', "escaped": "\\", "newline": "a\nb"},
+    [1, [2, [3]]],
+    "x\\\\\"]",
+    {},
+    [],
+    None,
+    1.5,
+    {"nested": {"list": [{"a": "}"}]}},
+]
+
+
+def read(filename):
+    with pymince.file.xopen(filename, mode="rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("n", (1, 2, 3, 9, 20))
+@pytest.mark.parametrize("indent", (None, 2, "\t"))
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_split_dumped_file(extension, indent, n):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(src, DATA, indent=indent)
+        paths = pymince.json.split_file(src, n)
+        assert paths == [os.path.join(tmpdir, f"foo-{i}{extension}") for i in range(n)]
+
+        pieces = [pymince.json.load_from(path) for path in paths]
+        assert [obj for piece in pieces for obj in piece] == DATA
+        for path, piece in zip(paths, pieces):
+            expected = os.path.join(tmpdir, f"expected{extension}")
+            pymince.json.idump_into(expected, piece, indent=indent)
+            assert read(path) == read(expected)
+
+
+@pytest.mark.parametrize("content", ("[1, 2, 3]", " [\n  1,\n  2\n  , 3 ]\n", "[\r\n1,\r\n2,\r\n3\r\n]\r\n"))
+def test_split_any_layout(content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "foo.json")
+        with open(src, mode="w", newline="") as f:
+            f.write(content)
+        pattern = os.path.join(tmpdir, "piece{}.json.gz")
+        paths = pymince.json.split_file(src, 2, pattern=pattern)
+        pieces = [pymince.json.load_from(path) for path in paths]
+    assert [obj for piece in pieces for obj in piece] == [1, 2, 3]
+
+
+def test_split_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "foo.json")
+        pymince.json.idump_into(src, [])
+        paths = pymince.json.split_file(src, 2)
+        assert [pymince.json.load_from(path) for path in paths] == [[], []]
+
+
+@pytest.mark.parametrize("content", ("", '{"a": 1}', "[1, 2"))
+def test_split_not_array(content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "foo.json")
+        with open(src, mode="w") as f:
+            f.write(content)
+        with pytest.raises(ValueError):
+            pymince.json.split_file(src, 2)
+
+
+def test_split_invalid_n():
+    with pytest.raises(ValueError):
+        pymince.json.split_file("foo.json", 0)
+
+
+def test_split_and_concat():
+    data = [{"n": n, "text": "ñó" * (n % 5)} for n in range(1000)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "foo.json.gz")
+        dst = os.path.join(tmpdir, "bar.json.gz")
+        pymince.json.idump_into(src, data)
+        paths = pymince.json.split_file(src, 7)
+        sizes = [len(json.dumps(pymince.json.load_from(path))) for path in paths]
+        assert max(sizes) < 2 * min(sizes)
+        pymince.json.concat_files(paths, dst)
+        assert read(dst) == read(src)
+
+
+@pytest.mark.parametrize("extension", (".json.gz", ".json"))
+def test_split_balanced_by_consumed_bytes(extension):
+    data = [{"n": n, "text": os.urandom(16).hex()} for n in range(20000)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.idump_into(src, data)
+        assert os.path.getsize(src) >= 4 * 64 * 1024  # Not measured by decompressing it.
+        paths = pymince.json.split_file(src, 4)
+        pieces = [pymince.json.load_from(path) for path in paths]
+    assert [obj for piece in pieces for obj in piece] == data
+    sizes = list(map(len, pieces))
+    assert max(sizes) < 1.2 * min(sizes)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import logging
+import os
+import tempfile
+import uuid
+
+import pytest
+
+import pymince.dictionary
+import pymince.file
+import pymince.json
+import pymince.logging
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: float
+
+
+CORPUS = (
+    None,
+    True,
+    0,
+    -1,
+    2**63,
+    2**70,
+    0.1,
+    -2.25,
+    1.0,
+    1e16,
+    1e-05,
+    123456.789,
+    "",
+    "ñó € 𝄞",
+    "quote\" backslash\\ slash/ \x00\x1f\x7f\n\t",
+    [],
+    {},
+    [1, [2, [3, {}]]],
+    {"b": 1, "a": {"d": [0.5, None], "c": "x"}},
+    {10: "int key", 2: "int key"},
+    {"text": "3e5 and 0.00001 inside strings"},
+)
+
+RICH_CORPUS = (
+    {"date": datetime.date(2021, 1, 2), "datetime": datetime.datetime(2021, 1, 1, 10, 30)},
+    {"decimal": decimal.Decimal("1.10"), "uuid": uuid.UUID(int=1), "enum": Color.RED},
+    {"set": {"b", "a"}, "bytes": b"\x00\x01", "point": Point(1, 2.5)},
+)
+
+DUMPS_KWARGS = (
+    {},
+    {"separators": (",", ":")},
+    {"separators": (",", ":"), "sort_keys": True},
+    {"indent": 2},
+    {"indent": 2, "sort_keys": True},
+    {"indent": 4},
+    {"separators": (",", ":"), "ensure_ascii": True},
+)
+
+
+def get_backend(name):
+    if name != "stdlib":
+        pytest.importorskip(name)
+    return name
+
+
+@pytest.fixture(params=("stdlib", "orjson", "ujson"))
+def backend(request):
+    name = get_backend(request.param)
+    assert pymince.json.use_backend(name) == name
+    yield name
+    pymince.json.use_backend("stdlib")
+
+
+@pytest.mark.parametrize("kwargs", DUMPS_KWARGS)
+@pytest.mark.parametrize("obj", CORPUS)
+def test_dumps_identical(backend, obj, kwargs):
+    expected = json.dumps(obj, **{"ensure_ascii": False, **kwargs})
+    assert pymince.json.json_dumps(obj, **kwargs) == expected
+
+
+@pytest.mark.parametrize("kwargs", DUMPS_KWARGS)
+@pytest.mark.parametrize("obj", RICH_CORPUS)
+def test_dumps_identical_with_encoder(backend, obj, kwargs):
+    expected = json.dumps(obj, cls=pymince.json.JSONEncoder, **{"ensure_ascii": False, **kwargs})
+    assert pymince.json.json_dumps(obj, cls=pymince.json.JSONEncoder, **kwargs) == expected
+
+
+@pytest.mark.parametrize("obj", CORPUS)
+def test_loads_identical(backend, obj):
+    string = json.dumps(obj)
+    assert pymince.json.json_loads(string) == json.loads(string)
+
+
+@pytest.mark.parametrize("string", ("NaN", "[Infinity]", '"\\ud800"'))
+def test_loads_stdlib_extensions(backend, string):
+    assert repr(pymince.json.json_loads(string)) == repr(json.loads(string))
+
+
+def test_loads_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        pymince.json.json_loads("[1,")
+
+
+@pytest.mark.parametrize("obj", ({"set": {1}}, {"circular": []}, {"uuid": uuid.UUID(int=5)}, {"enum": Color.RED}))
+@pytest.mark.parametrize("kwargs", ({"separators": (",", ":")}, {"indent": 2}, {"cls": json.JSONEncoder}))
+def test_dumps_errors(backend, obj, kwargs):
+    if "circular" in obj:
+        obj["circular"].append(obj)
+    with pytest.raises((TypeError, ValueError)):
+        pymince.json.json_dumps(obj, **kwargs)
+
+
+@pytest.mark.parametrize("value", (float("nan"), float("inf"), -float("inf")))
+@pytest.mark.parametrize("cls", (None, pymince.json.JSONEncoder))
+def test_dumps_not_finite(backend, value, cls):
+    kwargs = {"cls": cls, "separators": (",", ":")}
+    assert pymince.json.json_dumps([value, None], **kwargs) == json.dumps([value, None], **kwargs)
+    with pytest.raises(ValueError):
+        pymince.json.json_dumps([value, None], allow_nan=False, **kwargs)
+
+
+def test_dumps_not_finite_inside_converted(backend):
+    obj = {"point": Point(1, float("nan")), "none": None}
+    kwargs = {"cls": pymince.json.JSONEncoder, "separators": (",", ":")}
+    assert pymince.json.json_dumps(obj, **kwargs) == json.dumps(obj, **kwargs)
+
+
+def test_dumps_encoder_with_own_enum_converter(backend):
+    class Encoder(pymince.json.JSONEncoder):
+        pass
+
+    Encoder.register(enum.Enum, lambda e: e.name)
+    res = pymince.json.json_dumps({"enum": Color.RED}, cls=Encoder, separators=(",", ":"))
+    assert res == '{"enum":"RED"}'
+
+
+@pytest.mark.parametrize("extension", (".json", ".json.gz"))
+def test_dump_into_load_from(backend, extension):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, f"foo{extension}")
+        pymince.json.dump_into(filename, CORPUS[-3], indent=2)
+        with pymince.file.xopen(filename, mode="rt") as f:
+            assert f.read() == json.dumps(CORPUS[-3], indent=2)
+        assert pymince.json.load_from(filename) == CORPUS[-3]
+
+
+def test_digest_getter(backend):
+    payload = {**RICH_CORPUS[0], "text": "ñó", "set": {"a", "b"}}
+    assert pymince.dictionary.DigestGetter()(payload) == "b978489d6499025fcaa070e66353a016"
+
+
+def test_structured_formatter(backend):
+    record = logging.LogRecord("name", logging.INFO, "path", 1, "", ({"text": "ñó", "n": 1},), None)
+    record.created = 0
+    res = pymince.logging.StructuredFormatter().format(record)
+    assert res.endswith(',"level":"INFO","payload":{"text":"\\u00f1\\u00f3","n":1}}')
+
+
+def test_custom_backend():
+    backend = pymince.json.Backend("custom", lambda s: "loaded", lambda obj, **kwargs: "dumped")
+    try:
+        assert pymince.json.use_backend(backend) == "custom"
+        assert pymince.json.json_loads("1") == "loaded"
+        assert pymince.json.json_dumps(1) == "dumped"
+    finally:
+        pymince.json.use_backend("stdlib")
+
+
+def test_missing_backend(monkeypatch):
+    def factory():
+        raise ImportError
+
+    monkeypatch.setitem(pymince.json.backends, "missing", factory)
+    with pytest.warns(RuntimeWarning):
+        assert pymince.json.use_backend("missing") == "stdlib"
+    assert pymince.json.json_dumps({"a": "ñ"}) == '{"a": "ñ"}'
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        pymince.json.use_backend("unknown")
+
+
+def test_digest_getter_follows_backend():
+    getter = pymince.dictionary.DigestGetter()
+    payload = {"b": [1, 2.5], "a": "ñó"}
+    expected = getter(payload)
+    try:
+        pymince.json.use_backend(pymince.json.Backend("custom", json.loads, lambda obj, **kwargs: "dumped"))
+        assert getter(payload) != expected
+    finally:
+        pymince.json.use_backend("stdlib")
+    assert getter(payload) == expected
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import zipfile
+
+import pytest
+
+import pymince.json
+
+
+def test_dump_many_members():
+    data = {"key": "ñó", "nested": [1, 2, 3]}
+    items = [{"value": n} for n in range(100)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = os.path.join(tmpdir, "archive.zip")
+        with pymince.json.ZipJSONWriter(archive) as writer:
+            writer.dump("foo.json", data)
+            writer.idump("var.json", iter(items), indent=2)
+            writer.idump("empty.json", ())
+
+        assert pymince.json.load_from_zip(archive, "foo.json") == data
+        assert pymince.json.load_from_zip(archive, "var.json") == items
+        assert pymince.json.load_from_zip(archive, "empty.json") == []
+
+
+def test_append_members():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = shutil.make_archive(tmpdir, "zip", root_dir=tmpdir)
+        pymince.json.dump_into_zip(archive, "foo.json", {"a": 1})
+        with pymince.json.ZipJSONWriter(archive) as writer:
+            writer.dump("var.json", {"b": 2})
+
+        assert pymince.json.load_from_zip(archive, "foo.json") == {"a": 1}
+        assert pymince.json.load_from_zip(archive, "var.json") == {"b": 2}
+
+
+def test_truncate_mode():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = os.path.join(tmpdir, "archive.zip")
+        with pymince.json.ZipJSONWriter(archive) as writer:
+            writer.dump("foo.json", {"a": 1})
+        with pymince.json.ZipJSONWriter(archive, mode="w") as writer:
+            writer.dump("var.json", {"b": 2})
+
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.namelist() == ["var.json"]
+
+
+@pytest.mark.parametrize("compression", (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA))
+def test_compression(compression):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = os.path.join(tmpdir, "archive.zip")
+        with pymince.json.ZipJSONWriter(archive, compression=compression, compresslevel=None) as writer:
+            writer.idump("foo.json", [{"a": 1}] * 10)
+
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.getinfo("foo.json").compress_type == compression
+        assert pymince.json.load_from_zip(archive, "foo.json") == [{"a": 1}] * 10
@@ -6,6 +6,7 @@ import os
 
 import ruamel.yaml
 
+import pymince.aiterator
 import pymince.algorithm
 import pymince.benchmark
 import pymince.boolean
@@ -23,6 +24,7 @@ import pymince.xml
 import pymince.patterns
 
 modules = (
+    pymince.aiterator,
     pymince.algorithm,
     pymince.benchmark,
     pymince.boolean,